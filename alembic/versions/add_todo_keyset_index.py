@@ -0,0 +1,26 @@
+"""Add keyset pagination index to todos table
+
+Revision ID: add_todo_keyset_index
+Revises: add_is_admin_001
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = 'add_todo_keyset_index'
+down_revision: str | None = 'add_is_admin_001'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Index the (created_at, id) keyset used by cursor pagination per user
+    op.create_index('idx_user_created_id', 'todos', ['user_id', 'created_at', 'id'])
+
+
+def downgrade() -> None:
+    # Remove the keyset pagination index
+    op.drop_index('idx_user_created_id', table_name='todos')
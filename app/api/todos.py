@@ -85,8 +85,17 @@ async def get_todos(
     search: str | None = None,
     sort_by: TodoSortFields = TodoSortFields.CREATED_AT,
     order: SortOrder = SortOrder.DESC,
+    cursor: UUID | None = None,
 ) -> TodoListResponse:
     """Get all todos with pagination and filtering."""
+    # due_date is nullable, so it cannot form a keyset
+    # (the ``status`` query parameter shadows fastapi.status here)
+    if cursor and sort_by == TodoSortFields.DUE_DATE:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported when sorting by due_date"
+        )
+
     # Create filter and sort objects
     filter_params = None
     if status or category_id or search:
@@ -97,20 +106,28 @@ async def get_todos(
         )
 
     service = TodoService(db)
-    todos, total = await service.get_todos(
-        user_id=UUID(current_user),
-        limit=pagination.limit,
-        offset=pagination.offset,
-        filter_params=filter_params,
-        sort_by=sort_by.value,
-        order=order.value,
-    )
+    try:
+        todos, total = await service.get_todos(
+            user_id=UUID(current_user),
+            limit=pagination.limit,
+            offset=pagination.offset,
+            filter_params=filter_params,
+            sort_by=sort_by.value,
+            order=order.value,
+            cursor=cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
+    # A cache hit hands back plain dicts, so read the cursor off the
+    # validated items rather than the service result
+    items = [TodoResponse.model_validate(todo) for todo in todos]
     return TodoListResponse(
-        items=[TodoResponse.model_validate(todo) for todo in todos],
+        items=items,
         total=total,
         limit=pagination.limit,
-        offset=pagination.offset,
+        offset=0 if cursor else pagination.offset,
+        next_cursor=items[-1].id if len(items) == pagination.limit else None,
     )
 
 
@@ -1,11 +1,16 @@
 """Configuration settings for the Todo API."""
 
 import logging
-import os
 import re
 import secrets
 
-from pydantic import Field, SecretStr, field_validator, model_validator
+from pydantic import (
+    Field,
+    SecretStr,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 logger = logging.getLogger(__name__)
@@ -138,10 +143,13 @@ class Settings(BaseSettings):
 
     @field_validator("secret_key", mode="after")
     @classmethod
-    def validate_secret_key_strength(cls, v: SecretStr | None) -> SecretStr:
+    def validate_secret_key_strength(
+        cls, v: SecretStr | None, info: ValidationInfo
+    ) -> SecretStr:
         """Enhanced validation with detailed feedback."""
         if not v:
-            if os.getenv("ENVIRONMENT", "development") == "production":
+            # environment is declared before secret_key, so it is already parsed
+            if info.data.get("environment", "development") == "production":
                 raise ValueError("SECRET_KEY is required in production")
             # Development fallback
             logger.warning(
@@ -1,8 +1,10 @@
 """Middleware registry and configuration."""
+import bisect
+from collections.abc import Callable
 from dataclasses import dataclass
 
 from fastapi import FastAPI
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp
 
 from app.config import settings
 from app.middleware.error_handler import ErrorHandlerMiddleware
@@ -15,7 +17,7 @@ from app.middleware.security import SecurityHeadersMiddleware
 @dataclass
 class MiddlewareConfig:
     """Configuration for a middleware component."""
-    middleware_class: type[BaseHTTPMiddleware]
+    middleware_class: Callable[..., ASGIApp]  # BaseHTTPMiddleware or pure ASGI
     enabled: bool = True
     config: dict = None
     order: int = 0  # Lower numbers execute first
@@ -30,22 +32,34 @@ class MiddlewareRegistry:
 
     def __init__(self):
         self.middleware_configs = []
+        # (class, kwargs) pairs in add_middleware order, built on first apply
+        self._frozen_plan: list[tuple[Callable[..., ASGIApp], dict]] | None = None
+        # Enabled flags the plan was built from; a change forces a rebuild
+        self._plan_flags: tuple[bool, ...] | None = None
 
     def register(self, config: MiddlewareConfig):
         """Register a middleware configuration."""
-        self.middleware_configs.append(config)
-        # Sort by order
-        self.middleware_configs.sort(key=lambda x: x.order)
+        # Keep sorted by order; ties stay in registration order
+        bisect.insort(self.middleware_configs, config, key=lambda x: x.order)
+        self._frozen_plan = None
 
     def apply_to_app(self, app: FastAPI):
         """Apply all registered middleware to the app."""
-        # Apply in reverse order (last registered executes first)
-        for config in reversed(self.middleware_configs):
-            if config.enabled and settings.middleware_enabled:
-                app.add_middleware(
-                    config.middleware_class,
-                    **config.config
-                )
+        flags = (
+            settings.middleware_enabled,
+            *(config.enabled for config in self.middleware_configs),
+        )
+        if self._frozen_plan is None or flags != self._plan_flags:
+            # Apply in reverse order (last registered executes first)
+            self._frozen_plan = [
+                (config.middleware_class, config.config)
+                for config in reversed(self.middleware_configs)
+                if config.enabled and settings.middleware_enabled
+            ]
+            self._plan_flags = flags
+
+        for middleware_class, kwargs in self._frozen_plan:
+            app.add_middleware(middleware_class, **kwargs)
 
 
 def create_middleware_registry() -> MiddlewareRegistry:
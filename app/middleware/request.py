@@ -4,15 +4,20 @@ import logging
 from fastapi import Request
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from app.config import settings
 
 logger = logging.getLogger(__name__)
 
 
-class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
-    """Middleware to limit request body size."""
+class RequestSizeLimitMiddleware:
+    """Middleware to limit request body size.
+
+    Implemented as plain ASGI rather than ``BaseHTTPMiddleware``: it only reads
+    a header, so it should not pay for the extra task and streams that
+    ``call_next`` sets up on every request.
+    """
 
     def __init__(
         self,
@@ -30,46 +35,63 @@ class RequestSizeLimitMiddleware(BaseHTTPMiddleware):
             error_message: Custom error message
             include_max_size_in_error: Include max size in error response
         """
-        super().__init__(app)
+        self.app = app
         self.max_size = max_size or settings.max_request_size
         self.error_message = error_message
         self.include_max_size_in_error = include_max_size_in_error
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Check request size before processing."""
-        content_length = request.headers.get("content-length")
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = None
+        for name, value in scope["headers"]:
+            if name == b"content-length":
+                content_length = value
+                break
 
         if content_length:
             try:
+                # int() parses the raw header bytes without a decode
                 size = int(content_length)
-                if size > self.max_size:
-                    logger.warning(
-                        f"Request size {size} exceeds limit {self.max_size} "
-                        f"from {request.client.host}"
-                    )
-
-                    error_detail = {
-                        "detail": self.error_message,
-                        "type": "request_too_large"
-                    }
-
-                    if self.include_max_size_in_error:
-                        error_detail["max_size_bytes"] = self.max_size
-                        error_detail["max_size_mb"] = round(self.max_size / 1024 / 1024, 2)
-
-                    return JSONResponse(
-                        status_code=413,
-                        content=error_detail
-                    )
             except ValueError:
-                logger.error(f"Invalid Content-Length header: {content_length}")
-                return JSONResponse(
+                logger.error(
+                    "Invalid Content-Length header: "
+                    f"{content_length.decode('latin-1')}"
+                )
+                response = JSONResponse(
                     status_code=400,
                     content={"detail": "Invalid Content-Length header"}
                 )
+                await response(scope, receive, send)
+                return
+
+            if size > self.max_size:
+                client = scope.get("client")
+                logger.warning(
+                    f"Request size {size} exceeds limit {self.max_size} "
+                    f"from {client[0] if client else 'unknown'}"
+                )
 
-        response = await call_next(request)
-        return response
+                error_detail = {
+                    "detail": self.error_message,
+                    "type": "request_too_large"
+                }
+
+                if self.include_max_size_in_error:
+                    error_detail["max_size_bytes"] = self.max_size
+                    error_detail["max_size_mb"] = round(self.max_size / 1024 / 1024, 2)
+
+                response = JSONResponse(
+                    status_code=413,
+                    content=error_detail
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
 
 
 class RequestTimeoutMiddleware(BaseHTTPMiddleware):
@@ -32,6 +32,8 @@ class Todo(Base):
         Index("idx_user_status", "user_id", "status"),
         Index("idx_due_date", "due_date"),
         Index("idx_category_id", "category_id"),
+        # Serves the default created_at keyset pagination of a user's todos
+        Index("idx_user_created_id", "user_id", "created_at", "id"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(
@@ -1,5 +1,7 @@
 """Database metrics collection using SQLAlchemy events."""
+import re
 import time
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import event
@@ -16,6 +18,30 @@ from app.monitoring.metrics import (
 
 logger = get_logger(__name__)
 
+# Leading SQL verb, matched once per query on the after_cursor_execute path
+_OPERATION_RE = re.compile(
+    r"\s*(select|insert|update|delete|begin|commit|rollback)\b", re.IGNORECASE
+)
+_OPERATION_MAP = {
+    "select": "select",
+    "insert": "insert",
+    "update": "update",
+    "delete": "delete",
+    "begin": "transaction",
+    "commit": "transaction",
+    "rollback": "transaction",
+}
+# Table name following the verb, per operation
+_TABLE_RES = {
+    operation: re.compile(pattern, re.IGNORECASE | re.DOTALL)
+    for operation, pattern in {
+        "select": r'\s*select\b.*?\sfrom\s+"?([\w.]+)',
+        "insert": r'\s*insert\s+into\s+"?([\w.]+)',
+        "update": r'\s*update\s+(?:only\s+)?"?([\w.]+)',
+        "delete": r'\s*delete\s+from\s+(?:only\s+)?"?([\w.]+)',
+    }.items()
+}
+
 
 def setup_db_metrics(engine: Engine) -> None:
     """Set up database metrics collection using SQLAlchemy events.
@@ -80,6 +106,9 @@ def setup_db_metrics(engine: Engine) -> None:
     logger.info("Database metrics collection configured")
 
 
+# SQLAlchemy reuses a small set of statement strings, so both extractors are
+# memoized on the statement text
+@lru_cache(maxsize=2048)
 def _extract_operation(statement: str) -> str:
     """Extract SQL operation from statement.
     
@@ -89,26 +118,13 @@ def _extract_operation(statement: str) -> str:
     Returns:
         Operation type (select, insert, update, delete, other)
     """
-    statement_lower = statement.lower().strip()
-
-    if statement_lower.startswith("select"):
-        return "select"
-    elif statement_lower.startswith("insert"):
-        return "insert"
-    elif statement_lower.startswith("update"):
-        return "update"
-    elif statement_lower.startswith("delete"):
-        return "delete"
-    elif statement_lower.startswith("begin"):
-        return "transaction"
-    elif statement_lower.startswith("commit"):
-        return "transaction"
-    elif statement_lower.startswith("rollback"):
-        return "transaction"
-    else:
+    match = _OPERATION_RE.match(statement)
+    if match is None:
         return "other"
+    return _OPERATION_MAP[match.group(1).lower()]
 
 
+@lru_cache(maxsize=4096)
 def _extract_table(statement: str, operation: str) -> str:
     """Extract table name from SQL statement.
     
@@ -119,39 +135,16 @@ def _extract_table(statement: str, operation: str) -> str:
     Returns:
         Table name or "unknown"
     """
-    statement_lower = statement.lower()
-
-    try:
-        if operation == "select":
-            # Extract from FROM clause
-            from_idx = statement_lower.find(" from ")
-            if from_idx > -1:
-                rest = statement_lower[from_idx + 6:].strip()
-                table = rest.split()[0].strip('"')
-                return table
-
-        elif operation == "insert":
-            # Extract from INSERT INTO
-            into_idx = statement_lower.find(" into ")
-            if into_idx > -1:
-                rest = statement_lower[into_idx + 6:].strip()
-                table = rest.split()[0].strip('"')
-                return table
-
-        elif operation in ["update", "delete"]:
-            # Extract from UPDATE/DELETE FROM
-            parts = statement_lower.split()
-            if len(parts) > 1:
-                # Skip keywords
-                for i, part in enumerate(parts[1:], 1):
-                    if part not in ["from", "only"]:
-                        return part.strip('"')
-
-    except Exception:
-        # Fallback for complex queries
-        pass
-
-    return "unknown"
+    pattern = _TABLE_RES.get(operation)
+    if pattern is None:
+        return "unknown"
+
+    # Anchored on the verb, so statements such as CTEs fall through to
+    # "unknown"; only the captured name is lowercased, never the statement
+    match = pattern.match(statement)
+    if match is None:
+        return "unknown"
+    return match.group(1).lower()
 
 
 def _update_pool_metrics(pool: Pool) -> None:
@@ -12,16 +12,24 @@ user_id_context: ContextVar[str | None] = ContextVar("user_id", default=None)
 trace_id_context: ContextVar[str | None] = ContextVar("trace_id", default=None)
 span_id_context: ContextVar[str | None] = ContextVar("span_id", default=None)
 
+# Record attribute names paired with the context variable that fills them
+_CONTEXT_VARS = (
+    ("request_id", request_id_context),
+    ("user_id", user_id_context),
+    ("trace_id", trace_id_context),
+    ("span_id", span_id_context),
+)
+
 
 class ContextFilter(logging.Filter):
     """Filter to add context variables to log records."""
 
     def filter(self, record: logging.LogRecord) -> bool:
         """Add context variables to the log record."""
-        record.request_id = request_id_context.get()
-        record.user_id = user_id_context.get()
-        record.trace_id = trace_id_context.get()
-        record.span_id = span_id_context.get()
+        # Runs for every log record; write straight into the instance dict
+        attrs = record.__dict__
+        for name, context in _CONTEXT_VARS:
+            attrs[name] = context.get()
         return True
 
 
@@ -96,6 +96,10 @@ class TodoListResponse(PaginatedResponse):
     """Schema for paginated todo list response."""
 
     items: list[TodoResponse] = Field(..., description="List of todos")
+    next_cursor: UUID | None = Field(
+        None,
+        description="Pass as `cursor` to fetch the next page; null on the last page"
+    )
 
     model_config = BaseSchema.model_config.copy()
     model_config["json_schema_extra"] = {
@@ -103,7 +107,8 @@ class TodoListResponse(PaginatedResponse):
             "items": [TodoResponse.model_config["json_schema_extra"]["example"]],
             "total": 42,
             "limit": 20,
-            "offset": 0
+            "offset": 0,
+            "next_cursor": "123e4567-e89b-12d3-a456-426614174002"
         }
     }
 
@@ -4,6 +4,7 @@ import json
 from collections.abc import Callable
 from typing import Any
 
+import orjson
 import redis.asyncio as redis
 from redis.exceptions import RedisError
 
@@ -51,7 +52,7 @@ class CacheService:
         """Create a hash from dictionary for cache key."""
         # Sort keys for consistent hashing
         sorted_data = json.dumps(data, sort_keys=True)
-        return hashlib.md5(sorted_data.encode()).hexdigest()
+        return hashlib.blake2b(sorted_data.encode(), digest_size=16).hexdigest()
 
     async def get(self, namespace: str, key: str) -> Any | None:
         """Get value from cache.
@@ -70,11 +71,11 @@ class CacheService:
 
             if value:
                 cache_hits_total.labels(namespace=namespace).inc()
-                return json.loads(value)
+                return orjson.loads(value)
             cache_misses_total.labels(namespace=namespace).inc()
             return None
 
-        except (RedisError, json.JSONDecodeError) as e:
+        except (RedisError, orjson.JSONDecodeError) as e:
             # Log error but don't fail the request
             print(f"Cache get error: {e}")
             return None
@@ -100,7 +101,7 @@ class CacheService:
         try:
             client = await self._get_redis()
             cache_key = self._make_key(namespace, key)
-            serialized = json.dumps(value)
+            serialized = orjson.dumps(value)
 
             await client.setex(cache_key, ttl, serialized)
             cache_sets_total.labels(namespace=namespace).inc()
@@ -166,15 +167,42 @@ class CacheService:
     async def invalidate_user_cache(self, user_id: str) -> None:
         """Invalidate all cache entries for a specific user.
 
+        One SCAN covers the todos, categories and user namespaces, and the
+        matching keys are deleted in a single pipelined round trip.
+
         Args:
             user_id: User ID to invalidate cache for
         """
-        # Invalidate todos
-        await self.delete_pattern("todos", f"user:{user_id}:*")
-        # Invalidate categories
-        await self.delete_pattern("categories", f"user:{user_id}:*")
-        # Invalidate user-specific data
-        await self.delete_pattern("user", f"{user_id}:*")
+        user_prefixes = {
+            "todos": self._make_key("todos", f"user:{user_id}:"),
+            "categories": self._make_key("categories", f"user:{user_id}:"),
+            "user": self._make_key("user", f"{user_id}:"),
+        }
+        try:
+            client = await self._get_redis()
+
+            keys_by_namespace: dict[str, list[str]] = {}
+            async for key in client.scan_iter(match=f"{self._prefix}*{user_id}:*"):
+                for namespace, prefix in user_prefixes.items():
+                    if key.startswith(prefix):
+                        keys_by_namespace.setdefault(namespace, []).append(key)
+                        break
+
+            if not keys_by_namespace:
+                return
+
+            pipe = client.pipeline()
+            for keys in keys_by_namespace.values():
+                pipe.delete(*keys)
+            deleted_counts = await pipe.execute()
+
+            for namespace, deleted_count in zip(
+                keys_by_namespace, deleted_counts, strict=True
+            ):
+                cache_deletes_total.labels(namespace=namespace).inc(deleted_count)
+
+        except RedisError as e:
+            print(f"Cache invalidate user error: {e}")
 
     async def get_or_set(
         self,
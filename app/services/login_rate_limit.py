@@ -1,9 +1,12 @@
 """Login attempt rate limiting service with exponential backoff."""
 
 import logging
-from datetime import datetime, timedelta
+import time
+from datetime import UTC, datetime
+from typing import Any
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 from redis.exceptions import RedisError
 
 from app.config import settings
@@ -11,10 +14,54 @@ from app.redis import get_redis_client
 
 logger = logging.getLogger(__name__)
 
+# Returns the lockout expiry if the account is still locked, otherwise
+# increments the counter (starting its window on the first attempt).
+# Lockouts are stored as epoch seconds; a value that is not a number is a
+# legacy ISO lockout and is kept, since its key TTL still ends it.
+# KEYS: attempts key, lockout key. ARGV: window seconds, current epoch seconds.
+_RECORD_ATTEMPT_LUA = """
+local locked_until = redis.call('GET', KEYS[2])
+if locked_until then
+    local until_ts = tonumber(locked_until)
+    if not until_ts or until_ts > tonumber(ARGV[2]) then
+        return {tonumber(redis.call('GET', KEYS[1]) or '0'), locked_until}
+    end
+    redis.call('DEL', KEYS[2])
+end
+local attempts = redis.call('INCR', KEYS[1])
+if attempts == 1 then
+    redis.call('EXPIRE', KEYS[1], ARGV[1])
+end
+return {attempts, false}
+"""
+
+
+def _lockout_timestamp(value: str) -> int:
+    """Parse a stored lockout expiry, treating unparseable values as expired.
+
+    Lockouts written before the switch to epoch seconds hold a naive UTC ISO
+    timestamp; those are still honoured until they run out.
+    """
+    if value.isdigit():
+        return int(value)
+    try:
+        return int(datetime.fromisoformat(value).replace(tzinfo=UTC).timestamp())
+    except ValueError:
+        return 0
+
+
+def _lockout_datetime(timestamp: int) -> datetime:
+    """Convert a lockout expiry to the naive UTC datetime returned to callers."""
+    return datetime.fromtimestamp(timestamp, UTC).replace(tzinfo=None)
+
 
 class LoginRateLimitService:
     """Service for rate limiting login attempts with exponential backoff."""
 
+    # Shared by all instances (one is built per request); each call passes
+    # its own client, so the script is only bound to a client for its SHA
+    _record_attempt_script: AsyncScript | None = None
+
     def __init__(self, redis_client: redis.Redis | None = None):
         """Initialize the login rate limit service.
 
@@ -57,24 +104,25 @@ class LoginRateLimitService:
             key = f"{self._prefix}{email}"
             lockout_key = f"{self._lockout_prefix}{email}"
 
-            # Check if account is currently locked
-            locked_until = await client.get(lockout_key)
+            # Lockout check, increment and window expiry in one round trip
+            cls = type(self)
+            if cls._record_attempt_script is None:
+                cls._record_attempt_script = client.register_script(
+                    _RECORD_ATTEMPT_LUA
+                )
+            current_attempts, locked_until = await cls._record_attempt_script(
+                keys=[key, lockout_key],
+                args=[
+                    int(self.attempt_window_hours * 3600),
+                    int(time.time()),
+                ],
+                client=client,
+            )
             if locked_until:
-                locked_until_dt = datetime.fromisoformat(locked_until)
-                if locked_until_dt > datetime.utcnow():
-                    # Still locked
-                    attempt_count = await client.get(key) or "0"
-                    return int(attempt_count), locked_until_dt
-                else:
-                    # Lock expired, clear it
-                    await client.delete(lockout_key)
-
-            # Increment failed attempt counter
-            current_attempts = await client.incr(key)
-
-            # Set expiry on first attempt
-            if current_attempts == 1:
-                await client.expire(key, int(self.attempt_window_hours * 3600))
+                # Still locked
+                return current_attempts, _lockout_datetime(
+                    _lockout_timestamp(locked_until)
+                )
 
             # Check if we need to lock the account
             if current_attempts >= self.max_attempts:
@@ -88,21 +136,18 @@ class LoginRateLimitService:
                     self.max_lockout_minutes
                 )
 
-                lockout_until = datetime.utcnow() + timedelta(minutes=lockout_minutes)
+                lockout_seconds = int(lockout_minutes * 60)
+                lockout_until = int(time.time()) + lockout_seconds
 
-                # Store lockout timestamp
-                await client.setex(
-                    lockout_key,
-                    int(lockout_minutes * 60),
-                    lockout_until.isoformat()
-                )
+                # Store lockout expiry as epoch seconds
+                await client.setex(lockout_key, lockout_seconds, lockout_until)
 
                 logger.warning(
                     f"Account {email} locked for {lockout_minutes} minutes "
                     f"after {current_attempts} failed attempts"
                 )
 
-                return current_attempts, lockout_until
+                return current_attempts, _lockout_datetime(lockout_until)
 
             return current_attempts, None
 
@@ -129,21 +174,21 @@ class LoginRateLimitService:
             lockout_key = f"{self._lockout_prefix}{email}"
             attempts_key = f"{self._prefix}{email}"
 
-            # Check if account is locked
-            locked_until = await client.get(lockout_key)
+            # Fetch lockout and attempt count in one round trip
+            locked_until, current_attempts = await client.mget(
+                lockout_key, attempts_key
+            )
+            current_attempts = int(current_attempts or "0")
             if locked_until:
-                locked_until_dt = datetime.fromisoformat(locked_until)
-                if locked_until_dt > datetime.utcnow():
+                locked_until_ts = _lockout_timestamp(locked_until)
+                if locked_until_ts > time.time():
                     # Still locked
-                    current_attempts = await client.get(attempts_key) or "0"
-                    return False, locked_until_dt, int(current_attempts)
+                    return False, _lockout_datetime(locked_until_ts), current_attempts
                 else:
                     # Lock expired, clear it
                     await client.delete(lockout_key)
 
-            # Get current attempt count
-            current_attempts = await client.get(attempts_key) or "0"
-            return True, None, int(current_attempts)
+            return True, None, current_attempts
 
         except (RedisError, OSError, ConnectionError) as e:
             logger.error(f"Redis error in check_rate_limit: {e}")
@@ -186,11 +231,11 @@ class LoginRateLimitService:
             lockout_key = f"{self._lockout_prefix}{email}"
             attempts_key = f"{self._prefix}{email}"
 
-            # Check if account was locked
-            was_locked = await client.exists(lockout_key)
-
-            # Clear both lockout and attempts
-            await client.delete(lockout_key, attempts_key)
+            # Check for the lockout and clear both keys in one round trip
+            pipe = client.pipeline(transaction=False)
+            pipe.exists(lockout_key)
+            pipe.delete(lockout_key, attempts_key)
+            was_locked, _ = await pipe.execute()
 
             if was_locked:
                 logger.info(f"Account {email} manually unlocked by admin")
@@ -209,36 +254,45 @@ class LoginRateLimitService:
         """
         try:
             client = await self._get_redis()
-            locked_accounts = []
+            locked_accounts: list[dict[str, Any]] = []
 
             # Scan for all lockout keys
+            lockout_keys: list[str] = []
             cursor = 0
             while True:
                 cursor, keys = await client.scan(
                     cursor,
                     match=f"{self._lockout_prefix}*",
-                    count=100
+                    count=500
                 )
-
-                for key in keys:
-                    email = key.replace(self._lockout_prefix, "")
-                    locked_until = await client.get(key)
-                    if locked_until:
-                        locked_until_dt = datetime.fromisoformat(locked_until)
-                        if locked_until_dt > datetime.utcnow():
-                            # Get attempt count
-                            attempts_key = f"{self._prefix}{email}"
-                            attempts = await client.get(attempts_key) or "0"
-
-                            locked_accounts.append({
-                                "email": email,
-                                "locked_until": locked_until_dt,
-                                "failed_attempts": int(attempts)
-                            })
+                lockout_keys.extend(keys)
 
                 if cursor == 0:
                     break
 
+            if not lockout_keys:
+                return locked_accounts
+
+            # Fetch every lockout time and attempt count in one round trip
+            emails = [key.replace(self._lockout_prefix, "") for key in lockout_keys]
+            attempts_keys = [f"{self._prefix}{email}" for email in emails]
+            values = await client.mget(lockout_keys + attempts_keys)
+            lockout_values = values[:len(lockout_keys)]
+            attempt_values = values[len(lockout_keys):]
+
+            now = time.time()
+            for email, locked_until, attempts in zip(
+                emails, lockout_values, attempt_values, strict=True
+            ):
+                if locked_until:
+                    locked_until_ts = _lockout_timestamp(locked_until)
+                    if locked_until_ts > now:
+                        locked_accounts.append({
+                            "email": email,
+                            "locked_until": _lockout_datetime(locked_until_ts),
+                            "failed_attempts": int(attempts or "0")
+                        })
+
             return locked_accounts
 
         except RedisError as e:
@@ -2,9 +2,9 @@
 from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.models.todo import Todo, TodoStatus
 from app.monitoring.metrics import (
@@ -70,9 +70,11 @@ class TodoService:
     @cache_result("todos", ttl=300)
     async def get_todo(self, todo_id: UUID, user_id: UUID) -> Todo | None:
         """Get a specific todo by ID."""
+        # Single row: join the category in; a joined tags collection would
+        # need unique() on the result, so tags stay on one selectin query
         query = (
             select(Todo)
-            .options(selectinload(Todo.category))
+            .options(joinedload(Todo.category))
             .options(selectinload(Todo.tags))
             .where(
                 and_(
@@ -94,8 +96,27 @@ class TodoService:
         filter_params: TodoFilter | None = None,
         sort_by: str = "created_at",
         order: str = "desc",
+        cursor: UUID | None = None,
     ) -> tuple[list[Todo], int]:
-        """Get all todos for a user with pagination and filtering."""
+        """Get all todos for a user with pagination and filtering.
+
+        When ``cursor`` is the id of the last todo of the previous page, the
+        page starts right after it (keyset pagination) and ``offset`` is
+        ignored. ``total`` always counts every matching todo.
+
+        Raises:
+            ValueError: If ``cursor`` is not a todo owned by the user
+        """
+        if cursor is not None:
+            # An unknown cursor would seek past NULL and return an empty page
+            cursor_owned = await self.db.scalar(
+                select(Todo.id).where(
+                    and_(Todo.id == cursor, Todo.user_id == user_id)
+                )
+            )
+            if cursor_owned is None:
+                raise ValueError("Cursor does not match any of your todos")
+
         # Base query
         query = (
             select(Todo)
@@ -129,15 +150,29 @@ class TodoService:
         total_result = await self.db.execute(count_query)
         total = total_result.scalar_one()
 
-        # Apply sorting
+        # Apply sorting; id breaks ties so keyset pages are stable
         sort_column = getattr(Todo, sort_by, Todo.created_at)
         if order == "desc":
-            query = query.order_by(sort_column.desc())
+            query = query.order_by(sort_column.desc(), Todo.id.desc())
         else:
-            query = query.order_by(sort_column.asc())
+            query = query.order_by(sort_column.asc(), Todo.id.asc())
 
         # Apply pagination
-        query = query.limit(limit).offset(offset)
+        if cursor is not None:
+            # Seek past the cursor row's sort key instead of skipping rows
+            cursor_key = (
+                select(sort_column)
+                .where(and_(Todo.id == cursor, Todo.user_id == user_id))
+                .scalar_subquery()
+            )
+            position = tuple_(sort_column, Todo.id)
+            after = tuple_(cursor_key, literal(cursor))
+            query = query.where(
+                position < after if order == "desc" else position > after
+            )
+            query = query.limit(limit)
+        else:
+            query = query.limit(limit).offset(offset)
 
         # Execute query
         result = await self.db.execute(query)
@@ -213,6 +248,8 @@ class TodoService:
         """Get all todos for a specific category."""
         query = (
             select(Todo)
+            .options(selectinload(Todo.category))
+            .options(selectinload(Todo.tags))
             .where(
                 and_(
                     Todo.user_id == user_id,
@@ -1,15 +1,26 @@
 """Pytest configuration and fixtures."""
-import asyncio
+import itertools
+import os
 from collections.abc import AsyncGenerator, Generator
+from contextvars import ContextVar
 from datetime import UTC, datetime, timedelta
-from uuid import uuid4
+from functools import cache
+from typing import Any
+from unittest.mock import patch
+from uuid import UUID, uuid4
 
+import orjson
 import pytest
 import pytest_asyncio
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient, Limits, Response, Timeout
 from jose import jwt
-from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import delete, event, insert
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.pool import StaticPool
 
 from app.config import settings
@@ -18,24 +29,82 @@ from app.main import app
 
 # Import all models to ensure they are registered with Base.metadata
 from app.models import Category, Todo, User  # noqa: F401
+from app.models.tag import Tag
 from app.models.todo import TodoStatus
 from app.utils.security import get_password_hash
 
-# Test database URL - Using check_same_thread for SQLite
-TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
+# Test database URL - one named in-memory SQLite database per xdist worker
+XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "master")
+TEST_DATABASE_URL = (
+    f"sqlite+aiosqlite:///file:memdb_{XDIST_WORKER}"
+    "?mode=memory&cache=shared&uri=true"
+)
 
 
-@pytest.fixture(scope="session")
-def event_loop() -> Generator:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+# Database session the ``get_db`` override hands to request handlers
+current_test_session: ContextVar[AsyncSession | None] = ContextVar(
+    "current_test_session", default=None
+)
 
 
-@pytest_asyncio.fixture(scope="function")
-async def async_session() -> AsyncGenerator[AsyncSession, None]:
-    """Create a new database session for a test."""
+@cache
+def cached_password_hash(password: str) -> str:
+    """Hash each fixture password with bcrypt only once per session."""
+    return get_password_hash(password)
+
+
+def mint_session_token(user_id: UUID) -> str:
+    """Sign a JWT that stays valid for the whole test session."""
+    return jwt.encode(
+        {
+            "sub": str(user_id),
+            "exp": datetime.now(UTC) + timedelta(days=1),
+        },
+        settings.secret_key.get_secret_value(),
+        algorithm=settings.algorithm,
+    )
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register custom command line options."""
+    parser.addoption(
+        "--fast-limiter",
+        action="store_true",
+        default=False,
+        help="Count rate limits in process memory instead of Redis",
+    )
+    parser.addoption(
+        "--deep",
+        action="store_true",
+        default=False,
+        help="Trace every allocation with tracemalloc in memory load tests",
+    )
+
+
+@pytest.fixture(autouse=True)
+def fast_limiter(request: pytest.FixtureRequest) -> Generator:
+    """Swap the limiter backend for an in-memory moving window per test."""
+    if not request.config.getoption("--fast-limiter"):
+        yield
+        return
+
+    from limits.storage import MemoryStorage
+    from limits.strategies import MovingWindowRateLimiter
+
+    from app.middleware.rate_limit import limiter
+
+    storage = MemoryStorage()
+    with (
+        patch.object(limiter, "_storage", storage),
+        patch.object(limiter, "_limiter", MovingWindowRateLimiter(storage)),
+        patch.object(limiter, "_storage_dead", False),
+    ):
+        yield
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def engine() -> AsyncGenerator[AsyncEngine, None]:
+    """Create the test engine and schema once for the whole session."""
     # Create test engine with StaticPool for SQLite in-memory
     engine = create_async_engine(
         TEST_DATABASE_URL,
@@ -43,50 +112,101 @@ async def async_session() -> AsyncGenerator[AsyncSession, None]:
         poolclass=StaticPool,
     )
 
-    # Enable foreign key constraints for SQLite
+    # Enable foreign key constraints and keep journaling in RAM for SQLite
     @event.listens_for(engine.sync_engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
+        # Let SQLAlchemy emit BEGIN itself so SAVEPOINTs work with pysqlite
+        dbapi_connection.isolation_level = None
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA temp_store=MEMORY")
         cursor.close()
 
+    @event.listens_for(engine.sync_engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     # Create tables
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
-    # Create session
-    async_session_maker = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
-    async with async_session_maker() as session:
-        yield session
-
-    # Drop tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+    yield engine
 
     await engine.dispose()
 
 
 @pytest_asyncio.fixture(scope="function")
-async def client(async_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
-    """Create a test client."""
-    from httpx import ASGITransport
+async def async_session(
+    engine: AsyncEngine, test_user: User
+) -> AsyncGenerator[AsyncSession, None]:
+    """Create a new database session for a test."""
+    # test_user is committed on the shared connection, so it has to exist
+    # before this test's outer transaction is opened
+    # Run the test inside an outer transaction; session commits only
+    # release SAVEPOINTs and everything is rolled back afterwards. The
+    # "create_savepoint" mode opens a fresh SAVEPOINT after every commit or
+    # rollback, so no after_transaction_end listener is needed
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        async_session_maker = async_sessionmaker(
+            bind=conn,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
 
-    async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
-        yield async_session
+        async with async_session_maker() as session:
+            yield session
+
+        await trans.rollback()
 
-    app.dependency_overrides[get_db] = override_get_db
 
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def http_client() -> AsyncGenerator[AsyncClient, None]:
+    """Create one test client shared by the whole session."""
     async with AsyncClient(
-        transport=ASGITransport(app=app), base_url="http://test"
+        transport=ASGITransport(app=app),
+        base_url="http://test",
+        limits=Limits(
+            max_connections=100,
+            max_keepalive_connections=100,
+            keepalive_expiry=30,
+        ),
+        timeout=Timeout(10.0),
     ) as ac:
         yield ac
 
-    app.dependency_overrides.clear()
+
+async def override_get_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield the current test's session, or a real one outside ``client``."""
+    session = current_test_session.get()
+    if session is not None:
+        yield session
+        return
+    async for session in get_db():
+        yield session
+
+
+@pytest.fixture(scope="session", autouse=True)
+def db_dependency_override() -> Generator[None, None, None]:
+    """Install the ``get_db`` override once for the whole session."""
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(scope="function")
+async def client(
+    async_session: AsyncSession, http_client: AsyncClient
+) -> AsyncGenerator[AsyncClient, None]:
+    """Provide the shared test client bound to this test's database session."""
+    token = current_test_session.set(async_session)
+
+    yield http_client
+
+    current_test_session.reset(token)
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -95,38 +215,88 @@ async def test_db(async_session: AsyncSession) -> AsyncSession:
     return async_session
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_user(async_session: AsyncSession) -> User:
-    """Create a test user."""
+@pytest.fixture(scope="session")
+def test_user_pk() -> UUID:
+    """Primary key of the session-wide ``test_user``."""
+    return uuid4()
+
+
+@pytest.fixture(scope="session")
+def test_user_token(test_user_pk: UUID) -> str:
+    """Sign the ``test_user`` JWT once per test session."""
+    return mint_session_token(test_user_pk)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiter() -> None:
+    """Clear rate limit counters so tests sharing a user start fresh."""
+    from redis.exceptions import RedisError
+
+    from app.middleware.rate_limit import limiter
+
+    try:
+        limiter.reset()
+    except RedisError:
+        # Backend unavailable - requests are counted by the in-memory fallback
+        pass
+    if limiter._fallback_limiter is not None:
+        limiter._fallback_storage.reset()
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def test_user(engine: AsyncEngine, test_user_pk: UUID) -> User:
+    """Create a test user, committed once outside the per-test transactions."""
+    now = datetime.now(UTC)
     user = User(
-        id=uuid4(),
+        id=test_user_pk,
         email="test@example.com",
-        password_hash=get_password_hash("TestPassword123!"),
+        password_hash=cached_password_hash("TestPassword123!"),
         name="Test User",
         is_active=True,
         is_admin=False,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC)
+        created_at=now,
+        updated_at=now
     )
-    async_session.add(user)
-    await async_session.commit()
-    await async_session.refresh(user)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
     return user
 
 
-@pytest_asyncio.fixture(scope="function")
-async def auth_headers(test_user: User, app_settings) -> dict:
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def seeded_tags(engine: AsyncEngine) -> AsyncGenerator[list[Tag], None]:
+    """Create read-only tags once per module, outside the per-test transactions.
+
+    The tags are committed, so they are deleted again when the module finishes
+    to keep other modules' tag counts exact. Names carry a ``seed-`` prefix so
+    they never clash with the tags tests create themselves.
+    """
+    tags = [
+        Tag(name="seed-important", color="#FF00FF"),
+        Tag(name="seed-personal", color="#00FF00"),
+        Tag(name="seed-urgent", color="#FF0000"),
+        Tag(name="seed-work", color="#0000FF"),
+    ]
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add_all(tags)
+        await session.commit()
+
+    yield tags
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(Tag).where(Tag.id.in_([tag.id for tag in tags])))
+
+
+@pytest.fixture(scope="module")
+def seeded_tag_ids(seeded_tags: list[Tag]) -> dict[str, UUID]:
+    """Map each seeded tag name to its id."""
+    return {tag.name: tag.id for tag in seeded_tags}
+
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user: User, test_user_token: str) -> dict:
     """Create authentication headers with JWT token."""
-    access_token_expires = timedelta(minutes=app_settings.access_token_expire_minutes)
-    access_token = jwt.encode(
-        {
-            "sub": str(test_user.id),
-            "exp": datetime.now(UTC) + access_token_expires,
-        },
-        app_settings.secret_key.get_secret_value(),
-        algorithm=app_settings.algorithm,
-    )
-    return {"Authorization": f"Bearer {access_token}"}
+    return {"Authorization": f"Bearer {test_user_token}"}
 
 
 @pytest.fixture
@@ -200,35 +370,118 @@ async def create_test_todos(
     """Create multiple test todos for testing lists/filters."""
     from app.models.todo import Todo
 
-    todos = [
-        Todo(
-            title="Important Task",
-            description="Very important",
-            user_id=test_user.id,
-            category_id=test_category.id,
-            status=TodoStatus.OPEN
-        ),
-        Todo(
-            title="Completed Task",
-            description="Already done",
-            user_id=test_user.id,
-            status=TodoStatus.COMPLETED
-        ),
-        Todo(
-            title="Future Task",
-            due_date=datetime.now(UTC) + timedelta(days=30),
-            user_id=test_user.id,
-            status=TodoStatus.OPEN
-        )
-    ]
-
-    for todo in todos:
-        async_session.add(todo)
+    # One INSERT ... RETURNING hands back the ORM objects without refreshes
+    result = await async_session.execute(
+        insert(Todo).returning(Todo, sort_by_parameter_order=True),
+        [
+            {
+                "title": "Important Task",
+                "description": "Very important",
+                "user_id": test_user.id,
+                "category_id": test_category.id,
+                "status": TodoStatus.OPEN,
+            },
+            {
+                "title": "Completed Task",
+                "description": "Already done",
+                "user_id": test_user.id,
+                "status": TodoStatus.COMPLETED,
+            },
+            {
+                "title": "Future Task",
+                "due_date": datetime.now(UTC) + timedelta(days=30),
+                "user_id": test_user.id,
+                "status": TodoStatus.OPEN,
+            },
+        ],
+    )
+    todos = result.scalars().all()
     await async_session.commit()
 
     return todos
 
 
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def reader_user(engine: AsyncEngine) -> AsyncGenerator[User, None]:
+    """Create a user whose data is shared by a module's read-only tests.
+
+    Committed outside the per-test transactions; deleting the user at module
+    teardown cascades to everything seeded for it.
+    """
+    now = datetime.now(UTC)
+    user = User(
+        id=uuid4(),
+        email=f"reader-{uuid4().hex[:8]}@example.com",
+        password_hash=cached_password_hash("ReaderPassword123!"),
+        name="Reader User",
+        is_active=True,
+        is_admin=False,
+        created_at=now,
+        updated_at=now
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
+
+    yield user
+
+    async with engine.begin() as conn:
+        await conn.execute(delete(User).where(User.id == user.id))
+
+
+@pytest.fixture(scope="module")
+def reader_headers(reader_user: User) -> dict:
+    """Authentication headers for ``reader_user``."""
+    return {"Authorization": f"Bearer {mint_session_token(reader_user.id)}"}
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="session")
+async def create_test_todos_readonly(
+    engine: AsyncEngine, reader_user: User
+) -> list[Todo]:
+    """Create the ``create_test_todos`` set once per module for read-only tests.
+
+    The rows belong to ``reader_user`` so they never show up in ``test_user``
+    listings; query them with ``reader_headers`` and never mutate them.
+    """
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        category = Category(
+            id=uuid4(),
+            user_id=reader_user.id,
+            name="Test Category",
+            color="#FF5733"
+        )
+        session.add(category)
+        await session.flush()
+        result = await session.execute(
+            insert(Todo).returning(Todo, sort_by_parameter_order=True),
+            [
+                {
+                    "title": "Important Task",
+                    "description": "Very important",
+                    "user_id": reader_user.id,
+                    "category_id": category.id,
+                    "status": TodoStatus.OPEN,
+                },
+                {
+                    "title": "Completed Task",
+                    "description": "Already done",
+                    "user_id": reader_user.id,
+                    "status": TodoStatus.COMPLETED,
+                },
+                {
+                    "title": "Future Task",
+                    "due_date": datetime.now(UTC) + timedelta(days=30),
+                    "user_id": reader_user.id,
+                    "status": TodoStatus.OPEN,
+                },
+            ],
+        )
+        todos = result.scalars().all()
+        await session.commit()
+    return todos
+
+
 @pytest_asyncio.fixture(scope="function")
 async def other_user_todo(
     async_session: AsyncSession
@@ -240,7 +493,7 @@ async def other_user_todo(
     other_user = User(
         id=uuid4(),
         email="other@example.com",
-        password_hash=get_password_hash("OtherPassword123!"),
+        password_hash=cached_password_hash("OtherPassword123!"),
         name="Other User",
         is_active=True
     )
@@ -371,19 +624,52 @@ async def category_with_many_todos(
     await async_session.refresh(category)
     return category
 
+@pytest.fixture(scope="session")
+def rjson():
+    """Decode response bodies with orjson instead of httpx's stdlib json."""
+    def decode(response: Response) -> Any:
+        return orjson.loads(response.content)
+
+    return decode
+
+
 @pytest.fixture
 def exhaust_rate_limit():
     """Helper to exhaust rate limit for a user."""
-    async def _exhaust(client: AsyncClient, headers: dict):
-        # Make requests until we hit 429
-        for _ in range(200):  # Safety limit
-            response = await client.get(
-                "/api/v1/todos",
-                headers=headers
+    from starlette.requests import Request
+
+    from app.middleware.rate_limit import get_rate_limit_key, limiter
+
+    async def _exhaust(
+        client: AsyncClient, headers: dict, path: str = "/api/v1/todos"
+    ):
+        # One real request settles which limiter backend is live
+        response = await client.get(path, headers=headers)
+        if response.status_code == 429:
+            return
+
+        # Fill every configured window for this user and path instead of
+        # making requests until we hit 429
+        key = get_rate_limit_key(Request({
+            "type": "http",
+            "headers": [(b"authorization", headers["Authorization"].encode())],
+            "client": None,
+        }))
+        limit_items = {
+            lim.limit for lim in itertools.chain(
+                *limiter._default_limits, *limiter._route_limits.values()
             )
-            if response.status_code == 429:
-                return
-        raise Exception("Failed to hit rate limit")
+        }
+        for item in limit_items:
+            remaining = limiter.limiter.get_window_stats(item, key, path).remaining
+            if remaining:
+                limiter.limiter.hit(item, key, path, cost=remaining)
+
+        # The seed leans on slowapi internals; fail loudly if it missed
+        response = await client.get(path, headers=headers)
+        assert response.status_code == 429, (
+            f"Seeding the rate limit for {path} did not exhaust it"
+        )
 
     return _exhaust
 
@@ -416,18 +702,31 @@ async def second_user_headers(
 
     return {"Authorization": f"Bearer {token}"}
 
+@pytest.fixture(scope="session")
+def admin_user_pk() -> UUID:
+    """Primary key used for ``admin_user`` in every test."""
+    return uuid4()
+
+
+@pytest.fixture(scope="session")
+def admin_token(admin_user_pk: UUID) -> str:
+    """Sign the ``admin_user`` JWT once per test session."""
+    return mint_session_token(admin_user_pk)
+
+
 @pytest_asyncio.fixture(scope="function")
-async def admin_user(async_session: AsyncSession) -> User:
+async def admin_user(async_session: AsyncSession, admin_user_pk: UUID) -> User:
     """Create an admin user."""
+    now = datetime.now(UTC)
     user = User(
-        id=uuid4(),
+        id=admin_user_pk,
         email="admin@example.com",
-        password_hash=get_password_hash("AdminPassword123!"),
+        password_hash=cached_password_hash("AdminPassword123!"),
         name="Admin User",
         is_active=True,
         is_admin=True,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC)
+        created_at=now,
+        updated_at=now
     )
     async_session.add(user)
     await async_session.commit()
@@ -436,32 +735,24 @@ async def admin_user(async_session: AsyncSession) -> User:
 
 
 @pytest_asyncio.fixture(scope="function")
-async def admin_headers(admin_user: User, app_settings) -> dict:
+async def admin_headers(admin_user: User, admin_token: str) -> dict:
     """Create authentication headers with JWT token for admin."""
-    access_token_expires = timedelta(minutes=app_settings.access_token_expire_minutes)
-    access_token = jwt.encode(
-        {
-            "sub": str(admin_user.id),
-            "exp": datetime.now(UTC) + access_token_expires,
-        },
-        app_settings.secret_key.get_secret_value(),
-        algorithm=app_settings.algorithm,
-    )
-    return {"Authorization": f"Bearer {access_token}"}
+    return {"Authorization": f"Bearer {admin_token}"}
 
 @pytest_asyncio.fixture(scope="function")
 async def second_user_with_category(async_session: AsyncSession) -> dict:
     """Create a second test user with their own category."""
     # Create a second user
+    now = datetime.now(UTC)
     second_user = User(
         id=uuid4(),
         email="seconduser@example.com",
-        password_hash=get_password_hash("SecondPassword123!"),
+        password_hash=cached_password_hash("SecondPassword123!"),
         name="Second User",
         is_active=True,
         is_admin=False,
-        created_at=datetime.now(UTC),
-        updated_at=datetime.now(UTC)
+        created_at=now,
+        updated_at=now
     )
     async_session.add(second_user)
     await async_session.flush()  # Get ID
@@ -471,7 +762,7 @@ async def second_user_with_category(async_session: AsyncSession) -> dict:
         id=uuid4(),
         name="Second User's Category",
         user_id=second_user.id,
-        created_at=datetime.now(UTC)
+        created_at=now
     )
     async_session.add(category)
     await async_session.commit()
@@ -479,19 +770,10 @@ async def second_user_with_category(async_session: AsyncSession) -> dict:
     return {"user": second_user, "category": category}
 
 
-@pytest_asyncio.fixture(scope="function")
-async def test_user_headers(test_user: User, app_settings) -> dict:
+@pytest.fixture(scope="session")
+def test_user_headers(auth_headers: dict) -> dict:
     """Alias for auth_headers - for backward compatibility."""
-    access_token_expires = timedelta(minutes=app_settings.access_token_expire_minutes)
-    access_token = jwt.encode(
-        {
-            "sub": str(test_user.id),
-            "exp": datetime.now(UTC) + access_token_expires,
-        },
-        app_settings.secret_key.get_secret_value(),
-        algorithm=app_settings.algorithm,
-    )
-    return {"Authorization": f"Bearer {access_token}"}
+    return auth_headers
 
 
 @pytest.fixture
@@ -1,5 +1,6 @@
 """Integration tests for authentication with rate limiting."""
 
+from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
@@ -321,3 +322,35 @@ class TestAuthRateLimit:
         data = response.json()
         assert data["detail"]["failed_attempts"] == 1
         assert data["detail"]["remaining_attempts"] == 4
+
+    async def test_record_attempt_script_against_redis(self, monkeypatch):
+        """Test the record-attempt Lua script on a real Redis server."""
+        # Register the script on this test's client, not a mock from elsewhere
+        monkeypatch.setattr(LoginRateLimitService, "_record_attempt_script", None)
+        service = LoginRateLimitService()
+        client = await service._get_redis()
+        email = f"script-{uuid4()}@example.com"
+        attempts_key = f"failed_attempts:{email}"
+        lockout_key = f"account_locked:{email}"
+
+        try:
+            # The first attempt starts the counter's 24h window
+            attempts, lockout = await service.record_failed_attempt(email)
+            assert (attempts, lockout) == (1, None)
+            assert 0 < await client.ttl(attempts_key) <= 24 * 3600
+
+            # Reaching the threshold stores the lockout
+            for _ in range(service.max_attempts - 1):
+                attempts, lockout = await service.record_failed_attempt(email)
+            assert attempts == service.max_attempts
+            assert lockout is not None
+            assert await client.exists(lockout_key)
+
+            # While locked the script returns early without counting
+            assert await service.record_failed_attempt(email) == (
+                service.max_attempts, lockout
+            )
+            assert await client.get(attempts_key) == str(service.max_attempts)
+        finally:
+            await client.delete(attempts_key, lockout_key)
+            await service.close()
@@ -1,5 +1,6 @@
 """Integration tests for caching functionality."""
 import pytest
+from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.schemas.todo import TodoCreate
@@ -89,3 +90,27 @@ async def test_get_todos_caching(
 
     # Clean up
     await cache_service.delete_pattern("todos", f"user:{test_user.id}:*")
+
+
+@pytest.mark.asyncio
+async def test_cached_full_page_keeps_next_cursor(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_user,
+    create_test_todos
+):
+    """Test that a full page served from cache still carries next_cursor."""
+    cache_service = await get_cache_service()
+    await cache_service.delete_pattern("todos", f"user:{test_user.id}:*")
+
+    # The first request fills the cache, the second is answered from it
+    first = await client.get("/api/v1/todos/?limit=2", headers=auth_headers)
+    second = await client.get("/api/v1/todos/?limit=2", headers=auth_headers)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert first.json()["next_cursor"] is not None
+    assert second.json() == first.json()
+
+    # Clean up
+    await cache_service.delete_pattern("todos", f"user:{test_user.id}:*")
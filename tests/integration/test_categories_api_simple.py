@@ -144,18 +144,14 @@ class TestCategoriesAPISimple:
         )
         assert response.status_code == 404
 
-    async def test_authorization_required(self) -> None:
+    async def test_authorization_required(self, http_client: AsyncClient) -> None:
         """Test that endpoints require authentication."""
-        from httpx import ASGITransport
-        async with AsyncClient(
-            transport=ASGITransport(app=app), base_url="http://test"
-        ) as client:
-            # Test without auth
-            response = await client.get("/api/v1/categories/")
-            assert response.status_code == 403
-
-            response = await client.post(
-                "/api/v1/categories/",
-                json={"name": "Test", "color": "#000000"}
-            )
-            assert response.status_code == 403
+        # Test without auth
+        response = await http_client.get("/api/v1/categories/")
+        assert response.status_code == 403
+
+        response = await http_client.post(
+            "/api/v1/categories/",
+            json={"name": "Test", "color": "#000000"}
+        )
+        assert response.status_code == 403
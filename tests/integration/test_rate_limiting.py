@@ -2,8 +2,11 @@
 
 import asyncio
 import time
+from collections import Counter
+from datetime import timedelta
 
 import pytest
+from freezegun import freeze_time
 from httpx import AsyncClient
 
 
@@ -19,21 +22,17 @@ class TestRateLimiting:
         """Test per-minute rate limiting."""
         limit = 100  # Default rate limit per minute
 
-        # Make requests up to the limit
-        for _i in range(limit):
-            response = await client.get(
-                "/api/v1/todos",
-                headers=auth_headers
-            )
-            assert response.status_code == 200
+        # Fire one request past the limit concurrently; the limiter counts
+        # requests regardless of arrival order
+        responses = await asyncio.gather(*[
+            client.get("/api/v1/todos", headers=auth_headers)
+            for _ in range(limit + 1)
+        ])
 
-        # Next request should be rate limited
-        response = await client.get(
-            "/api/v1/todos",
-            headers=auth_headers
-        )
-        assert response.status_code == 429
-        assert "rate_limit_exceeded" in response.json()["error"]
+        assert sum(r.status_code == 200 for r in responses) == limit
+        limited = [r for r in responses if r.status_code == 429]
+        assert len(limited) == 1
+        assert "rate_limit_exceeded" in limited[0].json()["error"]
 
     async def test_rate_limit_headers(
         self,
@@ -87,12 +86,14 @@ class TestRateLimiting:
         limit = 100  # Default rate limit per minute
         endpoints = ["/api/v1/todos", "/api/v1/categories", "/api/v1/users/me"]
 
-        # Distribute requests across endpoints
+        # Distribute requests across endpoints; only status codes matter, so
+        # keep list bodies to a single item
         request_count = 0
         for i in range(limit + 5):
             endpoint = endpoints[i % len(endpoints)]
             response = await client.get(
                 endpoint,
+                params={"limit": 1},
                 headers=auth_headers
             )
 
@@ -108,17 +109,14 @@ class TestRateLimiting:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        second_user_headers: dict
+        second_user_headers: dict,
+        exhaust_rate_limit
     ):
         """Test that rate limits are per-user, not global."""
         # Exhaust first user's rate limit
-        for _ in range(10):
-            response = await client.get(
-                "/api/v1/todos",
-                headers=auth_headers
-            )
-            if response.status_code == 429:
-                break
+        await exhaust_rate_limit(client, auth_headers)
+        response = await client.get("/api/v1/todos", headers=auth_headers)
+        assert response.status_code == 429
 
         # Second user should still be able to make requests
         response = await client.get(
@@ -130,22 +128,30 @@ class TestRateLimiting:
     async def test_rate_limit_reset(
         self,
         client: AsyncClient,
-        auth_headers: dict
+        auth_headers: dict,
+        pytestconfig: pytest.Config
     ):
         """Test that rate limit resets after time window."""
-        # Make a few requests to get the reset time
-        response = await client.get(
-            "/api/v1/todos",
-            headers=auth_headers
-        )
-        reset_time = int(response.headers["X-RateLimit-Reset"])
+        # Redis expires windows on the server clock, which freeze_time
+        # cannot move; only the in-process backend follows the frozen clock
+        if not pytestconfig.getoption("--fast-limiter"):
+            pytest.skip("window expiry can only be simulated with --fast-limiter")
+
+        # Freeze the clock so the window can be advanced without sleeping
+        with freeze_time() as frozen:
+            # Make a few requests to get the reset time
+            response = await client.get(
+                "/api/v1/todos",
+                headers=auth_headers
+            )
+            reset_time = int(response.headers["X-RateLimit-Reset"])
 
-        # Calculate wait time (add buffer)
-        current_time = int(time.time())
-        wait_time = reset_time - current_time + 2
+            # Calculate wait time (add buffer)
+            current_time = int(time.time())
+            wait_time = reset_time - current_time + 2
+            assert 0 < wait_time < 65
 
-        if wait_time > 0 and wait_time < 65:  # Only wait if reasonable
-            await asyncio.sleep(wait_time)
+            frozen.tick(timedelta(seconds=wait_time))
 
             # Should be able to make requests again
             response = await client.get(
@@ -215,15 +221,10 @@ class TestRateLimiting:
 
         responses = await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Count successful vs rate limited
-        success_count = sum(
-            1 for r in responses
-            if not isinstance(r, Exception) and r.status_code == 200
-        )
-        rate_limited_count = sum(
-            1 for r in responses
-            if not isinstance(r, Exception) and r.status_code == 429
-        )
+        # Count successful vs rate limited in a single pass
+        counts = Counter(getattr(r, "status_code", None) for r in responses)
+        success_count = counts[200]
+        rate_limited_count = counts[429]
 
         # Some should succeed, some should be rate limited
         assert success_count > 0
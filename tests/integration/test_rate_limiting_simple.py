@@ -1,31 +1,41 @@
 """Simplified rate limiting tests to validate basic functionality."""
+import asyncio
+from uuid import uuid4
+
 import pytest
-from httpx import AsyncClient
+from httpx import AsyncClient, Response
+
+
+async def burst_until_429(
+    client: AsyncClient, url: str, total: int = 200, batch: int = 64
+) -> Response | None:
+    """Send up to ``total`` GETs in concurrent batches; return the first 429."""
+    for start in range(0, total, batch):
+        responses = await asyncio.gather(*[
+            client.get(url) for _ in range(min(batch, total - start))
+        ])
+        for response in responses:
+            if response.status_code == 429:
+                return response
+    return None
 
 
 @pytest.mark.asyncio
 async def test_rate_limit_on_public_endpoints(client: AsyncClient):
     """Test that rate limiting applies to public endpoints."""
     # Health endpoint should have rate limiting
-    for _i in range(200):
-        response = await client.get("/health")
-        if response.status_code == 429:
-            # Successfully hit rate limit
-            assert "rate_limit_exceeded" in response.json()["error"]
-            return
+    response = await burst_until_429(client, "/health")
+    if response is None:
+        pytest.fail("Rate limiting did not trigger after 200 requests")
 
-    # If we get here, rate limiting didn't trigger
-    pytest.fail("Rate limiting did not trigger after 200 requests")
+    # Successfully hit rate limit
+    assert "rate_limit_exceeded" in response.json()["error"]
 
 @pytest.mark.asyncio
 async def test_rate_limit_headers_in_error_response(client: AsyncClient):
     """Test that rate limit headers are included in 429 responses."""
     # Make many requests to trigger rate limit
-    response = None
-    for _i in range(200):
-        response = await client.get("/health")
-        if response.status_code == 429:
-            break
+    response = await burst_until_429(client, "/health")
 
     assert response is not None
     assert response.status_code == 429
@@ -35,25 +45,37 @@ async def test_rate_limit_headers_in_error_response(client: AsyncClient):
     assert int(response.headers["Retry-After"]) > 0
 
 @pytest.mark.asyncio
-async def test_login_endpoint_rate_limiting(client: AsyncClient):
+@pytest.mark.parametrize(
+    "distinct_users", [True, False], ids=["distinct_users", "same_user"]
+)
+async def test_login_endpoint_rate_limiting(
+    client: AsyncClient, distinct_users: bool
+):
     """Test stricter rate limits on auth endpoints."""
-    attempts = 0
+    # Failed-login counters and lockouts live in Redis and outlast the test,
+    # so burst against throwaway emails rather than a real user's
+    same_email = f"burst-{uuid4()}@example.com"
 
-    for i in range(20):
-        # Use proper form data format for login
-        response = await client.post(
+    # Only attempts below the limit reach the (slow) password check, so
+    # the burst can be sent concurrently
+    responses = await asyncio.gather(*[
+        client.post(
             "/api/v1/auth/login",
-            headers={"Content-Type": "application/x-www-form-urlencoded"},
-            data={
-                "username": f"test{i}@example.com",
+            json={
+                "email": (
+                    f"burst-{uuid4()}@example.com" if distinct_users
+                    else same_email
+                ),
                 "password": "wrongpassword"
             }
         )
+        for _ in range(10)
+    ])
 
-        if response.status_code == 429:
-            attempts = i
-            break
+    first_429 = next(
+        (i for i, r in enumerate(responses) if r.status_code == 429), None
+    )
 
     # Should hit rate limit quickly on auth endpoints
-    assert attempts < 20
-    assert attempts <= 10  # Expecting stricter limits
+    assert first_429 is not None
+    assert first_429 <= 5  # Expecting stricter limits
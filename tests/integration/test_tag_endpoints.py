@@ -1,7 +1,10 @@
 """Integration tests for tag endpoints."""
 
+import asyncio
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.tag import Tag
@@ -12,7 +15,8 @@ from app.models.user import User
 async def test_create_tag(
     client: AsyncClient,
     test_user: User,
-    auth_headers: dict
+    auth_headers: dict,
+    rjson
 ):
     """Test creating a new tag."""
     tag_data = {
@@ -27,7 +31,7 @@ async def test_create_tag(
     )
 
     assert response.status_code == 201
-    data = response.json()
+    data = rjson(response)
     assert data["name"] == "urgent"
     assert data["color"] == "#FF0000"
     assert "id" in data
@@ -40,13 +44,14 @@ async def test_create_tag_duplicate_name(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    async_session: AsyncSession,
+    rjson
 ):
     """Test creating a tag with duplicate name fails."""
     # Create first tag
     tag = Tag(name="urgent", color="#FF0000")
     async_session.add(tag)
-    await async_session.commit()
+    await async_session.flush()
 
     # Try to create duplicate
     tag_data = {"name": "urgent", "color": "#00FF00"}
@@ -58,7 +63,7 @@ async def test_create_tag_duplicate_name(
     )
 
     assert response.status_code == 400
-    assert "already exists" in response.json()["detail"]
+    assert "already exists" in rjson(response)["detail"]
 
 
 @pytest.mark.asyncio
@@ -67,7 +72,11 @@ async def test_create_tag_invalid_color(
     test_user: User,
     auth_headers: dict
 ):
-    """Test creating a tag with invalid color format."""
+    """Test creating a tag with invalid color format.
+
+    End-to-end 422 contract check; the individual validation cases live in
+    tests/unit/test_tag_schemas.py.
+    """
     tag_data = {
         "name": "test",
         "color": "red"  # Invalid format
@@ -87,30 +96,19 @@ async def test_get_all_tags(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    seeded_tags: list[Tag],
+    rjson
 ):
     """Test getting all tags."""
-    # Create test tags
-    tags = [
-        Tag(name="urgent", color="#FF0000"),
-        Tag(name="work", color="#0000FF"),
-        Tag(name="personal", color="#00FF00"),
-    ]
-    async_session.add_all(tags)
-    await async_session.commit()
-
     response = await client.get(
         "/api/v1/tags/",
         headers=auth_headers
     )
 
     assert response.status_code == 200
-    data = response.json()
-    assert len(data) == 3
+    data = rjson(response)
     # Should be ordered by name
-    assert data[0]["name"] == "personal"
-    assert data[1]["name"] == "urgent"
-    assert data[2]["name"] == "work"
+    assert [tag["name"] for tag in data] == [tag.name for tag in seeded_tags]
 
 
 @pytest.mark.asyncio
@@ -118,14 +116,11 @@ async def test_get_tag_by_id(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    seeded_tags: list[Tag],
+    rjson
 ):
     """Test getting a specific tag."""
-    # Create tag
-    tag = Tag(name="important", color="#FF00FF")
-    async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
+    tag = seeded_tags[0]
 
     response = await client.get(
         f"/api/v1/tags/{tag.id}",
@@ -133,9 +128,9 @@ async def test_get_tag_by_id(
     )
 
     assert response.status_code == 200
-    data = response.json()
+    data = rjson(response)
     assert data["id"] == str(tag.id)
-    assert data["name"] == "important"
+    assert data["name"] == "seed-important"
     assert data["color"] == "#FF00FF"
 
 
@@ -155,91 +150,58 @@ async def test_get_tag_not_found(
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("initial,update_data,expected_status,expected", [
+    (
+        [{"name": "urgent", "color": "#FF0000"}],
+        {"name": "very urgent", "color": "#FF5500"},
+        200,
+        {"name": "very urgent", "color": "#FF5500"},
+    ),
+    (
+        [{"name": "work", "color": "#0000FF"}],
+        {"color": "#00FF00"},  # Update only color
+        200,
+        {"name": "work", "color": "#00FF00"},  # Name unchanged
+    ),
+    (
+        [{"name": "urgent"}, {"name": "work"}],
+        {"name": "urgent"},  # Rename to the other tag's name
+        400,
+        None,
+    ),
+], ids=["full", "partial", "duplicate_name"])
 async def test_update_tag(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    async_session: AsyncSession,
+    initial: list[dict],
+    update_data: dict,
+    expected_status: int,
+    expected: dict | None,
+    rjson
 ):
-    """Test updating a tag."""
-    # Create tag
-    tag = Tag(name="urgent", color="#FF0000")
-    async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
-
-    update_data = {
-        "name": "very urgent",
-        "color": "#FF5500"
-    }
-
-    response = await client.put(
-        f"/api/v1/tags/{tag.id}",
-        json=update_data,
-        headers=auth_headers
+    """Test updating a tag; the last seeded tag is the one updated."""
+    # Create tag(s)
+    result = await async_session.execute(
+        insert(Tag).returning(Tag.id, sort_by_parameter_order=True),
+        initial,
     )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == "very urgent"
-    assert data["color"] == "#FF5500"
-
-
-@pytest.mark.asyncio
-async def test_update_tag_partial(
-    client: AsyncClient,
-    test_user: User,
-    auth_headers: dict,
-    async_session: AsyncSession
-):
-    """Test partial update of a tag."""
-    # Create tag
-    tag = Tag(name="work", color="#0000FF")
-    async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
-
-    # Update only color
-    update_data = {"color": "#00FF00"}
-
-    response = await client.put(
-        f"/api/v1/tags/{tag.id}",
-        json=update_data,
-        headers=auth_headers
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert data["name"] == "work"  # Unchanged
-    assert data["color"] == "#00FF00"  # Updated
-
-
-@pytest.mark.asyncio
-async def test_update_tag_duplicate_name(
-    client: AsyncClient,
-    test_user: User,
-    auth_headers: dict,
-    async_session: AsyncSession
-):
-    """Test updating a tag to duplicate name fails."""
-    # Create two tags
-    tag1 = Tag(name="urgent")
-    tag2 = Tag(name="work")
-    async_session.add_all([tag1, tag2])
-    await async_session.commit()
-    await async_session.refresh(tag2)
-
-    # Try to update tag2 with tag1's name
-    update_data = {"name": "urgent"}
+    tag_id = result.scalars().all()[-1]
 
     response = await client.put(
-        f"/api/v1/tags/{tag2.id}",
+        f"/api/v1/tags/{tag_id}",
         json=update_data,
         headers=auth_headers
     )
 
-    assert response.status_code == 400
-    assert "already exists" in response.json()["detail"]
+    assert response.status_code == expected_status
+    data = rjson(response)
+    if expected is None:
+        assert "already exists" in data["detail"]
+    else:
+        assert data["name"] == expected["name"]
+        assert data["color"] == expected["color"]
 
 
 @pytest.mark.asyncio
@@ -253,8 +215,7 @@ async def test_delete_tag(
     # Create tag
     tag = Tag(name="temporary")
     async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
+    await async_session.flush()
 
     response = await client.delete(
         f"/api/v1/tags/{tag.id}",
@@ -263,12 +224,10 @@ async def test_delete_tag(
 
     assert response.status_code == 204
 
-    # Verify it's gone
-    get_response = await client.get(
-        f"/api/v1/tags/{tag.id}",
-        headers=auth_headers
-    )
-    assert get_response.status_code == 404
+    # Verify it's gone straight from the DB instead of a second request
+    assert await async_session.scalar(
+        select(Tag.id).where(Tag.id == tag.id)
+    ) is None
 
 
 @pytest.mark.asyncio
@@ -300,15 +259,24 @@ async def test_tag_endpoints_require_auth(client: AsyncClient):
         ("DELETE", f"/api/v1/tags/{tag_id}", None),
     ]
 
-    for method, url, json_data in endpoints:
-        if method == "POST":
-            response = await client.post(url, json=json_data)
-        elif method == "GET":
-            response = await client.get(url)
-        elif method == "PUT":
-            response = await client.put(url, json=json_data)
-        elif method == "DELETE":
-            response = await client.delete(url)
-
-        # Accept both 401 (unauthorized) and 403 (rate limit exceeded for IP)
-        assert response.status_code in [401, 403], f"{method} {url} should require auth or be rate limited"
+    async def status_of(method: str, url: str, json_data: dict | None) -> int:
+        # Only the status matters, so stream and close without reading the body
+        request = client.build_request(method, url, json=json_data)
+        response = await client.send(request, stream=True)
+        await response.aclose()
+        return response.status_code
+
+    # Requests are independent, so send them concurrently
+    statuses = await asyncio.gather(*[
+        status_of(method, url, json_data)
+        for method, url, json_data in endpoints
+    ])
+
+    # Accept both 401 (unauthorized) and 403 (rate limit exceeded for IP);
+    # report every offending endpoint in a single assertion
+    unprotected = [
+        (method, url, status)
+        for (method, url, _), status in zip(endpoints, statuses, strict=True)
+        if status not in (401, 403)
+    ]
+    assert not unprotected, f"Endpoints should require auth: {unprotected}"
@@ -3,11 +3,15 @@ from uuid import uuid4
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Todo, User
 from app.models.category import Category
 
+# Fixed reference time so seeded rows and payloads are identical across runs
+FROZEN_NOW = datetime(2030, 1, 1, tzinfo=UTC)
+
 
 @pytest.mark.asyncio
 class TestTodoEndpoints:
@@ -16,7 +20,8 @@ class TestTodoEndpoints:
     async def test_create_todo_minimal(
         self,
         client: AsyncClient,
-        auth_headers: dict
+        auth_headers: dict,
+        rjson
     ):
         """Test creating todo with minimal data."""
         response = await client.post(
@@ -25,7 +30,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 201
-        data = response.json()
+        data = rjson(response)
         assert data["title"] == "Simple Todo"
         assert data["status"] == "open"
         assert data["category_id"] is None
@@ -34,10 +39,11 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_category: Category
+        test_category: Category,
+        rjson
     ):
         """Test creating todo with all fields."""
-        due_date = (datetime.now(UTC) + timedelta(days=7)).isoformat()
+        due_date = (FROZEN_NOW + timedelta(days=7)).isoformat()
         response = await client.post(
             "/api/v1/todos/",
             json={
@@ -49,7 +55,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 201
-        data = response.json()
+        data = rjson(response)
         assert data["description"] == "With all fields filled"
         assert data["category_id"] == str(test_category.id)
 
@@ -57,7 +63,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_category: Category
+        test_category: Category,
+        rjson
     ):
         """Test creating todo returns eagerly loaded category."""
         response = await client.post(
@@ -69,7 +76,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 201
-        data = response.json()
+        data = rjson(response)
         assert data["category_id"] == str(test_category.id)
         # Verify category is eagerly loaded
         assert "category" in data
@@ -79,7 +86,8 @@ class TestTodoEndpoints:
     async def test_create_todo_invalid_category(
         self,
         client: AsyncClient,
-        auth_headers: dict
+        auth_headers: dict,
+        rjson
     ):
         """Test creating todo with non-existent category."""
         response = await client.post(
@@ -91,13 +99,14 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 404
-        assert "Category not found" in response.json()["detail"]
+        assert "Category not found" in rjson(response)["detail"]
 
     async def test_create_todo_with_other_users_category_fails(
         self,
         client: AsyncClient,
         auth_headers: dict,
-        second_user_with_category: dict
+        second_user_with_category: dict,
+        rjson
     ):
         """Test that a user cannot create a todo with another user's category."""
         other_users_category_id = second_user_with_category["category"].id
@@ -112,21 +121,22 @@ class TestTodoEndpoints:
         )
 
         assert response.status_code == 404
-        assert "Category not found" in response.json()["detail"]
+        assert "Category not found" in rjson(response)["detail"]
 
     async def test_list_todos(
         self,
         client: AsyncClient,
-        auth_headers: dict,
-        create_test_todos  # Fixture that creates multiple todos
+        reader_headers: dict,
+        create_test_todos_readonly,  # Fixture that creates multiple todos
+        rjson
     ):
         """Test listing todos with pagination."""
         response = await client.get(
             "/api/v1/todos/?offset=0&limit=10",
-            headers=auth_headers
+            headers=reader_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "items" in data
         assert isinstance(data["items"], list)
         assert len(data["items"]) <= 10
@@ -135,16 +145,17 @@ class TestTodoEndpoints:
     async def test_list_todos_filtered_by_completion(
         self,
         client: AsyncClient,
-        auth_headers: dict,
-        create_test_todos
+        reader_headers: dict,
+        create_test_todos_readonly,
+        rjson
     ):
         """Test filtering todos by completion status."""
         response = await client.get(
             "/api/v1/todos/?status=completed",
-            headers=auth_headers
+            headers=reader_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "items" in data
         todos = data["items"]
         assert all(todo["status"] == "completed" for todo in todos)
@@ -152,16 +163,17 @@ class TestTodoEndpoints:
     async def test_search_todos(
         self,
         client: AsyncClient,
-        auth_headers: dict,
-        create_test_todos
+        reader_headers: dict,
+        create_test_todos_readonly,
+        rjson
     ):
         """Test searching todos by title/description."""
         response = await client.get(
             "/api/v1/todos/?search=important",
-            headers=auth_headers
+            headers=reader_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert "items" in data
         todos = data["items"]
         for todo in todos:
@@ -172,58 +184,119 @@ class TestTodoEndpoints:
     async def test_list_todos_pagination_empty_page(
         self,
         client: AsyncClient,
-        auth_headers: dict,
-        create_test_todos
+        reader_headers: dict,
+        create_test_todos_readonly,
+        rjson
     ):
         """Test pagination with offset beyond available items."""
         response = await client.get(
             "/api/v1/todos/?offset=10&limit=10",
-            headers=auth_headers
+            headers=reader_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["items"] == []
-        assert data["total"] == 3  # create_test_todos creates 3 todos
+        assert data["total"] == 3  # create_test_todos_readonly creates 3 todos
+
+        # The keyset equivalent: a cursor at the last todo yields an empty page
+        last_id = rjson(await client.get(
+            "/api/v1/todos/?limit=10",
+            headers=reader_headers
+        ))["items"][-1]["id"]
+        response = await client.get(
+            f"/api/v1/todos/?cursor={last_id}&limit=10",
+            headers=reader_headers
+        )
+        assert response.status_code == 200
+        data = rjson(response)
+        assert data["items"] == []
+        assert data["next_cursor"] is None
+
+    @pytest.mark.parametrize("sort_by,order", [
+        ("created_at", "desc"),
+        ("title", "asc"),
+    ])
+    async def test_list_todos_cursor_pagination(
+        self,
+        client: AsyncClient,
+        reader_headers: dict,
+        create_test_todos_readonly,
+        rjson,
+        sort_by: str,
+        order: str
+    ):
+        """Test walking the list page by page with next_cursor."""
+        url = f"/api/v1/todos/?sort_by={sort_by}&order={order}"
+        expected = [
+            todo["id"] for todo in rjson(await client.get(
+                f"{url}&limit=10", headers=reader_headers
+            ))["items"]
+        ]
+
+        first = rjson(await client.get(f"{url}&limit=2", headers=reader_headers))
+        assert first["next_cursor"] == expected[1]
+        assert first["total"] == 3
+
+        second = rjson(await client.get(
+            f"{url}&limit=2&cursor={first['next_cursor']}", headers=reader_headers
+        ))
+        assert second["next_cursor"] is None
+        assert second["total"] == 3
+
+        assert [todo["id"] for todo in first["items"] + second["items"]] == expected
+
+    async def test_list_todos_cursor_rejects_due_date_sort(
+        self,
+        client: AsyncClient,
+        auth_headers: dict
+    ):
+        """Test that cursor pagination is refused for the nullable due_date."""
+        response = await client.get(
+            f"/api/v1/todos/?sort_by=due_date&cursor={uuid4()}",
+            headers=auth_headers
+        )
+        assert response.status_code == 400
+
+    async def test_list_todos_cursor_rejects_unknown_todo(
+        self,
+        client: AsyncClient,
+        auth_headers: dict,
+        other_user_todo
+    ):
+        """Test that a missing or foreign cursor is a 400, not an empty page."""
+        for cursor in (uuid4(), other_user_todo.id):
+            response = await client.get(
+                f"/api/v1/todos/?cursor={cursor}",
+                headers=auth_headers
+            )
+            assert response.status_code == 400
 
     async def test_list_todos_sorting_by_title_asc(
         self,
         client: AsyncClient,
         auth_headers: dict,
         test_user: User,
-        async_session: AsyncSession
+        async_session: AsyncSession,
+        rjson
     ):
         """Test sorting todos by title in ascending order."""
-        # Create todos with specific titles
-        todos = [
-            Todo(
-                user_id=test_user.id,
-                title="C Task",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC)
-            ),
-            Todo(
-                user_id=test_user.id,
-                title="A Task",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC)
-            ),
-            Todo(
-                user_id=test_user.id,
-                title="B Task",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC)
-            )
-        ]
-        for todo in todos:
-            async_session.add(todo)
-        await async_session.commit()
+        # Create todos with specific titles in one executemany
+        await async_session.execute(insert(Todo), [
+            {
+                "user_id": test_user.id,
+                "title": title,
+                "created_at": FROZEN_NOW,
+                "updated_at": FROZEN_NOW
+            }
+            for title in ("C Task", "A Task", "B Task")
+        ])
 
         response = await client.get(
             "/api/v1/todos/?sort_by=title&order=asc",
             headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         items = data["items"]
         assert len(items) == 3
         assert items[0]["title"] == "A Task"
@@ -235,44 +308,28 @@ class TestTodoEndpoints:
         client: AsyncClient,
         auth_headers: dict,
         test_user: User,
-        async_session: AsyncSession
+        async_session: AsyncSession,
+        rjson
     ):
         """Test sorting todos by due date in descending order."""
-        # Create todos with specific due dates
-        now = datetime.now(UTC)
-        todos = [
-            Todo(
-                user_id=test_user.id,
-                title="Task 1",
-                due_date=now + timedelta(days=1),
-                created_at=now,
-                updated_at=now
-            ),
-            Todo(
-                user_id=test_user.id,
-                title="Task 2",
-                due_date=now + timedelta(days=2),
-                created_at=now,
-                updated_at=now
-            ),
-            Todo(
-                user_id=test_user.id,
-                title="Task 3",
-                due_date=now + timedelta(days=3),
-                created_at=now,
-                updated_at=now
-            )
-        ]
-        for todo in todos:
-            async_session.add(todo)
-        await async_session.commit()
+        # Create todos with specific due dates in one executemany
+        await async_session.execute(insert(Todo), [
+            {
+                "user_id": test_user.id,
+                "title": f"Task {days}",
+                "due_date": FROZEN_NOW + timedelta(days=days),
+                "created_at": FROZEN_NOW,
+                "updated_at": FROZEN_NOW
+            }
+            for days in (1, 2, 3)
+        ])
 
         response = await client.get(
             "/api/v1/todos/?sort_by=due_date&order=desc",
             headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         items = data["items"]
         assert len(items) == 3
         assert items[0]["title"] == "Task 3"  # Latest date first
@@ -283,7 +340,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_todo: Todo
+        test_todo: Todo,
+        rjson
     ):
         """Test getting a specific todo."""
         response = await client.get(
@@ -291,7 +349,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["id"] == str(test_todo.id)
         assert data["title"] == test_todo.title
 
@@ -324,7 +382,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_todo: Todo
+        test_todo: Todo,
+        rjson
     ):
         """Test updating a todo."""
         response = await client.patch(
@@ -336,7 +395,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["title"] == "Updated Title"
         assert data["status"] == "completed"
 
@@ -344,7 +403,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_todo: Todo
+        test_todo: Todo,
+        rjson
     ):
         """Test partial update (only some fields)."""
         response = await client.patch(
@@ -353,7 +413,7 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 200
-        data = response.json()
+        data = rjson(response)
         assert data["status"] == "completed"
         assert data["title"] == test_todo.title  # Unchanged
 
@@ -361,7 +421,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        test_todo: Todo
+        test_todo: Todo,
+        async_session: AsyncSession
     ):
         """Test deleting a todo."""
         response = await client.delete(
@@ -370,42 +431,42 @@ class TestTodoEndpoints:
         )
         assert response.status_code == 204
 
-        # Verify it's deleted
-        get_response = await client.get(
-            f"/api/v1/todos/{test_todo.id}",
-            headers=auth_headers
-        )
-        assert get_response.status_code == 404
+        # Verify it's soft deleted; hiding from GET is covered separately
+        assert await async_session.scalar(
+            select(Todo.deleted_at).where(Todo.id == test_todo.id)
+        ) is not None
 
     async def test_soft_deleted_todo_is_hidden_from_list_and_get(
         self,
         client: AsyncClient,
         auth_headers: dict,
         test_user: User,
-        async_session: AsyncSession
+        async_session: AsyncSession,
+        rjson
     ):
         """Test that soft-deleted todos are hidden from list and get endpoints."""
-        # Create 3 todos
-        todos = []
-        for i in range(3):
-            todo = Todo(
-                user_id=test_user.id,
-                title=f"Todo {i+1}",
-                created_at=datetime.now(UTC),
-                updated_at=datetime.now(UTC)
-            )
-            async_session.add(todo)
-            todos.append(todo)
-        await async_session.commit()
+        # Create 3 todos, keeping their ids in insertion order
+        created_ids = (await async_session.scalars(
+            insert(Todo).returning(Todo.id, sort_by_parameter_order=True),
+            [
+                {
+                    "user_id": test_user.id,
+                    "title": f"Todo {i+1}",
+                    "created_at": FROZEN_NOW,
+                    "updated_at": FROZEN_NOW
+                }
+                for i in range(3)
+            ]
+        )).all()
 
         # Get initial count
         response = await client.get("/api/v1/todos/", headers=auth_headers)
         assert response.status_code == 200
-        initial_data = response.json()
+        initial_data = rjson(response)
         initial_total = initial_data["total"]
 
         # Delete one todo
-        todo_to_delete_id = todos[1].id
+        todo_to_delete_id = created_ids[1]
         delete_response = await client.delete(
             f"/api/v1/todos/{todo_to_delete_id}",
             headers=auth_headers
@@ -415,7 +476,7 @@ class TestTodoEndpoints:
         # Check list endpoint - deleted todo should not be visible
         list_response = await client.get("/api/v1/todos/", headers=auth_headers)
         assert list_response.status_code == 200
-        list_data = list_response.json()
+        list_data = rjson(list_response)
 
         # Verify total count is reduced
         assert list_data["total"] == initial_total - 1
@@ -436,7 +497,8 @@ class TestTodoEndpoints:
         self,
         client: AsyncClient,
         auth_headers: dict,
-        create_test_todos
+        create_test_todos,
+        rjson
     ):
         """Test bulk updating multiple todos."""
         # Get todo IDs
@@ -444,7 +506,7 @@ class TestTodoEndpoints:
             "/api/v1/todos/",
             headers=auth_headers
         )
-        data = list_response.json()
+        data = rjson(list_response)
         assert "items" in data
         todos = data["items"]
         todo_ids = [todo["id"] for todo in todos[:3]]
@@ -459,4 +521,4 @@ class TestTodoEndpoints:
             headers=auth_headers
         )
         assert response.status_code == 200
-        assert response.json()["updated"] == len(todo_ids)
+        assert rjson(response)["updated"] == len(todo_ids)
@@ -1,35 +1,46 @@
 """Integration tests for todo endpoints with tag functionality."""
+from uuid import UUID
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.tag import Tag
 from app.models.todo import Todo
+from app.models.todo_tag import todo_tags
 from app.models.user import User
 
 
+async def create_tagged_todo(
+    session: AsyncSession, user_id: UUID, title: str, tag_ids: list[UUID]
+) -> UUID:
+    """Insert a todo linked to ``tag_ids`` and return its id."""
+    todo_id = await session.scalar(
+        insert(Todo).values(title=title, user_id=user_id).returning(Todo.id)
+    )
+    if tag_ids:
+        await session.execute(
+            insert(todo_tags),
+            [{"todo_id": todo_id, "tag_id": tag_id} for tag_id in tag_ids]
+        )
+    return todo_id
+
+
 @pytest.mark.asyncio
 async def test_create_todo_with_tags(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    seeded_tag_ids: dict[str, UUID]
 ):
     """Test creating a todo with tags via API."""
-    # Create tags first
-    tag1 = Tag(name="urgent", color="#FF0000")
-    tag2 = Tag(name="work", color="#0000FF")
-    async_session.add_all([tag1, tag2])
-    await async_session.commit()
-    await async_session.refresh(tag1)
-    await async_session.refresh(tag2)
-
-    # Create todo with tags
     todo_data = {
         "title": "Todo with tags",
         "description": "This todo has multiple tags",
-        "tag_ids": [str(tag1.id), str(tag2.id)]
+        "tag_ids": [
+            str(seeded_tag_ids["seed-urgent"]),
+            str(seeded_tag_ids["seed-work"]),
+        ]
     }
 
     response = await client.post(
@@ -42,53 +53,40 @@ async def test_create_todo_with_tags(
     data = response.json()
     assert len(data["tags"]) == 2
     tag_names = {tag["name"] for tag in data["tags"]}
-    assert tag_names == {"urgent", "work"}
+    assert tag_names == {"seed-urgent", "seed-work"}
 
 
 @pytest.mark.asyncio
+@pytest.mark.parametrize("initial,updated", [
+    (["seed-personal", "seed-important"], ["seed-important", "seed-work"]),
+    (["seed-urgent"], []),
+], ids=["replace_tags", "remove_all_tags"])
 async def test_update_todo_tags(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    async_session: AsyncSession,
+    seeded_tag_ids: dict[str, UUID],
+    initial: list[str],
+    updated: list[str]
 ):
-    """Test updating todo tags via API."""
-    # Create tags
-    tag1 = Tag(name="personal")
-    tag2 = Tag(name="important")
-    tag3 = Tag(name="work")
-    async_session.add_all([tag1, tag2, tag3])
-    await async_session.commit()
-    await async_session.refresh(tag1)
-    await async_session.refresh(tag2)
-    await async_session.refresh(tag3)
-
-    # Create todo with initial tags
-    todo = Todo(
-        title="Test todo",
-        user_id=test_user.id,
-        tags=[tag1, tag2]
+    """Test replacing and removing todo tags via API."""
+    todo_id = await create_tagged_todo(
+        async_session,
+        test_user.id,
+        "Test todo",
+        [seeded_tag_ids[name] for name in initial]
     )
-    async_session.add(todo)
-    await async_session.commit()
-    await async_session.refresh(todo)
-
-    # Update todo to replace tags
-    update_data = {
-        "tag_ids": [str(tag2.id), str(tag3.id)]
-    }
 
     response = await client.patch(
-        f"/api/v1/todos/{todo.id}",
-        json=update_data,
+        f"/api/v1/todos/{todo_id}",
+        json={"tag_ids": [str(seeded_tag_ids[name]) for name in updated]},
         headers=auth_headers
     )
 
     assert response.status_code == 200
     data = response.json()
-    assert len(data["tags"]) == 2
-    tag_names = {tag["name"] for tag in data["tags"]}
-    assert tag_names == {"important", "work"}
+    assert {tag["name"] for tag in data["tags"]} == set(updated)
 
 
 @pytest.mark.asyncio
@@ -96,33 +94,22 @@ async def test_get_todos_with_tags(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    async_session: AsyncSession,
+    seeded_tag_ids: dict[str, UUID]
 ):
     """Test getting todos includes their tags."""
-    # Create tags
-    tag1 = Tag(name="urgent")
-    tag2 = Tag(name="personal")
-    async_session.add_all([tag1, tag2])
-    await async_session.commit()
-
     # Create todos with different tags
-    todo1 = Todo(
-        title="Work todo",
-        user_id=test_user.id,
-        tags=[tag1]
-    )
-    todo2 = Todo(
-        title="Personal todo",
-        user_id=test_user.id,
-        tags=[tag2]
-    )
-    todo3 = Todo(
-        title="Mixed todo",
-        user_id=test_user.id,
-        tags=[tag1, tag2]
-    )
-    async_session.add_all([todo1, todo2, todo3])
-    await async_session.commit()
+    for title, tag_names in [
+        ("Work todo", ["seed-urgent"]),
+        ("Personal todo", ["seed-personal"]),
+        ("Mixed todo", ["seed-urgent", "seed-personal"]),
+    ]:
+        await create_tagged_todo(
+            async_session,
+            test_user.id,
+            title,
+            [seeded_tag_ids[name] for name in tag_names]
+        )
 
     # Get all todos
     response = await client.get(
@@ -139,14 +126,14 @@ async def test_get_todos_with_tags(
     todos_by_title = {todo["title"]: todo for todo in data["items"]}
 
     assert len(todos_by_title["Work todo"]["tags"]) == 1
-    assert todos_by_title["Work todo"]["tags"][0]["name"] == "urgent"
+    assert todos_by_title["Work todo"]["tags"][0]["name"] == "seed-urgent"
 
     assert len(todos_by_title["Personal todo"]["tags"]) == 1
-    assert todos_by_title["Personal todo"]["tags"][0]["name"] == "personal"
+    assert todos_by_title["Personal todo"]["tags"][0]["name"] == "seed-personal"
 
     assert len(todos_by_title["Mixed todo"]["tags"]) == 2
     mixed_tag_names = {tag["name"] for tag in todos_by_title["Mixed todo"]["tags"]}
-    assert mixed_tag_names == {"urgent", "personal"}
+    assert mixed_tag_names == {"seed-urgent", "seed-personal"}
 
 
 @pytest.mark.asyncio
@@ -176,61 +163,18 @@ async def test_create_todo_with_invalid_tag_ids(
     assert len(data["tags"]) == 0
 
 
-@pytest.mark.asyncio
-async def test_remove_all_tags_from_todo(
-    client: AsyncClient,
-    test_user: User,
-    auth_headers: dict,
-    async_session: AsyncSession
-):
-    """Test removing all tags from a todo."""
-    # Create tag
-    tag = Tag(name="temporary")
-    async_session.add(tag)
-    await async_session.commit()
-
-    # Create todo with tag
-    todo = Todo(
-        title="Todo with tag",
-        user_id=test_user.id,
-        tags=[tag]
-    )
-    async_session.add(todo)
-    await async_session.commit()
-    await async_session.refresh(todo)
-
-    # Remove all tags
-    update_data = {"tag_ids": []}
-
-    response = await client.patch(
-        f"/api/v1/todos/{todo.id}",
-        json=update_data,
-        headers=auth_headers
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert len(data["tags"]) == 0
-
-
 @pytest.mark.asyncio
 async def test_tag_included_in_todo_response_fields(
     client: AsyncClient,
     test_user: User,
     auth_headers: dict,
-    async_session: AsyncSession
+    seeded_tag_ids: dict[str, UUID]
 ):
     """Test that tag response includes all expected fields."""
-    # Create tag with all fields
-    tag = Tag(name="detailed", color="#123456")
-    async_session.add(tag)
-    await async_session.commit()
-    await async_session.refresh(tag)
-
-    # Create todo with tag
+    # Create todo with a tag that has all fields set
     todo_data = {
         "title": "Test todo",
-        "tag_ids": [str(tag.id)]
+        "tag_ids": [str(seeded_tag_ids["seed-work"])]
     }
 
     response = await client.post(
@@ -246,7 +190,7 @@ async def test_tag_included_in_todo_response_fields(
     assert len(data["tags"]) == 1
     tag_data = data["tags"][0]
     assert "id" in tag_data
-    assert tag_data["name"] == "detailed"
-    assert tag_data["color"] == "#123456"
+    assert tag_data["name"] == "seed-work"
+    assert tag_data["color"] == "#0000FF"
     assert "created_at" in tag_data
     assert "updated_at" in tag_data
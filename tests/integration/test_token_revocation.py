@@ -1,33 +1,59 @@
 """Integration tests for token revocation functionality."""
 
+import asyncio
+from datetime import UTC, datetime
+
 import pytest
 import pytest_asyncio
 from fastapi import status
 from httpx import AsyncClient
 from jose import jwt
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
 from app.config import settings
+from app.models.user import User
+from app.utils.security import get_password_hash
+
+_SECRET = settings.secret_key.get_secret_value()
+
+
+@pytest.fixture(scope="session")
+def test_user_credentials() -> dict:
+    """Test user credentials."""
+    return {
+        "email": "revoke_test@example.com",
+        "password": "TestPassword123!",
+        "name": "Revoke Test User"
+    }
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def _registered_user(engine: AsyncEngine, test_user_credentials: dict) -> User:
+    """Register the revocation test user once, outside the per-test transactions."""
+    now = datetime.now(UTC)
+    user = User(
+        email=test_user_credentials["email"],
+        password_hash=get_password_hash(test_user_credentials["password"]),
+        name=test_user_credentials["name"],
+        is_active=True,
+        is_admin=False,
+        created_at=now,
+        updated_at=now
+    )
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        session.add(user)
+        await session.commit()
+    return user
 
 
 class TestTokenRevocation:
     """Test cases for token revocation with race condition fixes."""
 
     @pytest_asyncio.fixture
-    async def test_user_credentials(self):
-        """Test user credentials."""
-        return {
-            "email": "revoke_test@example.com",
-            "password": "TestPassword123!",
-            "name": "Revoke Test User"
-        }
-
-    @pytest_asyncio.fixture
-    async def authenticated_client(self, client: AsyncClient, test_user_credentials) -> tuple[AsyncClient, str, dict]:
-        """Get authenticated client with token."""
-        # Register user
-        reg_response = await client.post("/api/v1/auth/register", json=test_user_credentials)
-        assert reg_response.status_code == 201
-
+    async def authenticated_client(
+        self, client: AsyncClient, _registered_user: User, test_user_credentials
+    ) -> tuple[str, dict]:
+        """Get a token and auth headers for the shared client."""
         # Login to get token
         login_data = {
             "email": test_user_credentials["email"],
@@ -39,10 +65,12 @@ class TestTokenRevocation:
         token = login_response.json()["access_token"]
         headers = {"Authorization": f"Bearer {token}"}
 
-        return client, token, headers
+        return token, headers
 
     @pytest.mark.asyncio
-    async def test_token_revocation_immediate_effect(self, authenticated_client):
+    async def test_token_revocation_immediate_effect(
+        self, client: AsyncClient, authenticated_client
+    ):
         """
         Verify that token revocation takes immediate effect.
         
@@ -50,18 +78,14 @@ class TestTokenRevocation:
         2. User logs out (increments token version)
         3. Old token immediately becomes invalid
         """
-        client, token, headers = authenticated_client
+        token, headers = authenticated_client
 
         # Verify token works before logout
         response = await client.get("/api/v1/users/me", headers=headers)
         assert response.status_code == status.HTTP_200_OK
 
-        # Decode token to check version
-        payload = jwt.decode(
-            token,
-            settings.secret_key.get_secret_value(),
-            algorithms=[settings.algorithm]
-        )
+        # Read the version claim without verifying the signature
+        payload = jwt.get_unverified_claims(token)
         initial_version = payload.get("token_version", 0)
 
         # Logout (this should increment token version)
@@ -74,28 +98,27 @@ class TestTokenRevocation:
         assert response.json()["detail"] == "Token has been revoked"
 
     @pytest.mark.asyncio
-    async def test_token_version_persists_across_requests(self, authenticated_client):
+    async def test_token_version_persists_across_requests(
+        self, client: AsyncClient, authenticated_client
+    ):
         """Verify token version is consistent across async contexts."""
-        client, token, headers = authenticated_client
+        token, headers = authenticated_client
 
-        # Decode token to get version
-        payload = jwt.decode(
-            token,
-            settings.secret_key.get_secret_value(),
-            algorithms=[settings.algorithm]
-        )
+        # Read the version claim
+        payload = jwt.get_unverified_claims(token)
         token_version = payload.get("token_version", 0)
 
-        # Make multiple concurrent requests
-        import asyncio
-
         async def make_request():
             response = await client.get("/api/v1/todos/", headers=headers)
             return response.status_code
 
+        async def make_concurrent_requests(count: int = 10) -> list[int]:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(make_request()) for _ in range(count)]
+            return [task.result() for task in tasks]
+
         # Run 10 concurrent requests
-        tasks = [make_request() for _ in range(10)]
-        results = await asyncio.gather(*tasks)
+        results = await make_concurrent_requests()
 
         # All should succeed with same token
         assert all(status_code == status.HTTP_200_OK for status_code in results)
@@ -104,18 +127,18 @@ class TestTokenRevocation:
         await client.post("/api/v1/auth/logout", headers=headers)
 
         # Run 10 more concurrent requests
-        tasks = [make_request() for _ in range(10)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await make_concurrent_requests()
 
         # All should fail with 401
         assert all(
             status_code == status.HTTP_401_UNAUTHORIZED
             for status_code in results
-            if not isinstance(status_code, Exception)
         )
 
     @pytest.mark.asyncio
-    async def test_new_login_after_logout_gets_new_version(self, client: AsyncClient, test_user_credentials):
+    async def test_new_login_after_logout_gets_new_version(
+        self, client: AsyncClient, _registered_user: User, test_user_credentials
+    ):
         """Verify that logging in after logout gets a new token with updated version."""
         # First login
         login_data = {
@@ -123,20 +146,13 @@ class TestTokenRevocation:
             "password": test_user_credentials["password"]
         }
 
-        # Register first
-        await client.post("/api/v1/auth/register", json=test_user_credentials)
-
         # Login
         response1 = await client.post("/api/v1/auth/login", json=login_data)
         token1 = response1.json()["access_token"]
         headers1 = {"Authorization": f"Bearer {token1}"}
 
         # Decode first token
-        payload1 = jwt.decode(
-            token1,
-            settings.secret_key.get_secret_value(),
-            algorithms=[settings.algorithm]
-        )
+        payload1 = jwt.get_unverified_claims(token1)
         version1 = payload1.get("token_version", 0)
 
         # Logout
@@ -147,11 +163,7 @@ class TestTokenRevocation:
         token2 = response2.json()["access_token"]
 
         # Decode second token
-        payload2 = jwt.decode(
-            token2,
-            settings.secret_key.get_secret_value(),
-            algorithms=[settings.algorithm]
-        )
+        payload2 = jwt.get_unverified_claims(token2)
         version2 = payload2.get("token_version", 0)
 
         # Version should be incremented
@@ -167,11 +179,10 @@ class TestTokenRevocation:
         assert response.status_code == status.HTTP_200_OK
 
     @pytest.mark.asyncio
-    async def test_logout_all_devices_revokes_all_tokens(self, client: AsyncClient, test_user_credentials):
+    async def test_logout_all_devices_revokes_all_tokens(
+        self, client: AsyncClient, _registered_user: User, test_user_credentials
+    ):
         """Test that logout-all-devices revokes all active tokens."""
-        # Register
-        await client.post("/api/v1/auth/register", json=test_user_credentials)
-
         login_data = {
             "email": test_user_credentials["email"],
             "password": test_user_credentials["password"]
@@ -202,16 +213,14 @@ class TestTokenRevocation:
             assert response.json()["detail"] == "Token has been revoked"
 
     @pytest.mark.asyncio
-    async def test_token_with_zero_version_still_validated(self, authenticated_client):
-        """Test that tokens with version 0 are still validated (backward compatibility)."""
-        client, token, headers = authenticated_client
-
-        # Decode token
-        payload = jwt.decode(
-            token,
-            settings.secret_key.get_secret_value(),
-            algorithms=[settings.algorithm]
-        )
+    async def test_token_with_zero_version_still_validated(
+        self, client: AsyncClient, authenticated_client
+    ):
+        """Test that version-0 tokens are still validated (backward compatibility)."""
+        token, headers = authenticated_client
+
+        # Verify the signature here; other tests only read the claims
+        payload = jwt.decode(token, _SECRET, algorithms=[settings.algorithm])
 
         # Token should have a version >= 0
         assert "token_version" in payload
@@ -1,52 +1,95 @@
 """Test memory usage with request size limits."""
 import asyncio
+import os
+import sys
 import tracemalloc
 
-from httpx import AsyncClient
+import pytest
+from httpx import ASGITransport, AsyncClient
 
 from app.main import app
 
 
-async def test_memory_with_size_limits():
-    """Test that the size limit middleware doesn't cause memory issues."""
-    tracemalloc.start()
+def memory_snapshot(deep: bool) -> int:
+    """Return a cheap memory reading, or traced bytes when ``deep`` is set.
+
+    ``sys.getallocatedblocks()`` is O(1) and adds no per-allocation hooks;
+    tracemalloc is only worth its overhead when a byte-exact figure is needed.
+    """
+    if deep:
+        return tracemalloc.get_traced_memory()[0]
+    return sys.getallocatedblocks()
+
+
+def current_rss_kb() -> int:
+    """Current resident set size of this process in KB (Linux only).
+
+    Unlike ``ru_maxrss``, which is a process-lifetime high-water mark, this
+    can show a change between two readings.
+    """
+    with open("/proc/self/statm") as statm:
+        resident_pages = int(statm.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
 
-    async with AsyncClient(app=app, base_url="http://test") as client:
-        # Test multiple requests with different sizes
+@pytest.fixture
+def deep(request: pytest.FixtureRequest) -> bool:
+    """Whether ``--deep`` asked for tracemalloc measurements."""
+    return request.config.getoption("--deep")
+
+
+async def check_memory_with_size_limits(deep: bool = False) -> None:
+    """Check that the size limit middleware doesn't cause memory issues."""
+    unit = "bytes" if deep else "blocks"
+    if deep:
+        tracemalloc.start()
+
+    # One client for the whole run; httpx needs an explicit ASGI transport
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        # Test multiple requests with different sizes, sent concurrently
         sizes = [1024, 10240, 102400, 1024000]  # 1KB, 10KB, 100KB, 1MB
 
         print("Testing memory usage with various request sizes:")
-        for size in sizes:
-            # Get baseline memory
-            baseline = tracemalloc.get_traced_memory()[0]
+        baseline = memory_snapshot(deep)
+        rss_baseline = current_rss_kb()
 
-            # Make request with specific size
-            headers = {"Content-Length": str(size)}
-            response = await client.get("/health", headers=headers)
-            assert response.status_code == 200
+        responses = await asyncio.gather(*[
+            client.get("/health", headers={"Content-Length": str(size)})
+            for size in sizes
+        ])
+        assert all(response.status_code == 200 for response in responses)
 
-            # Check memory after request
-            current = tracemalloc.get_traced_memory()[0]
-            memory_increase = current - baseline
+        memory_increase = memory_snapshot(deep) - baseline
+        rss_increase = current_rss_kb() - rss_baseline
 
-            print(f"Size: {size:>8} bytes | Memory increase: {memory_increase:>8} bytes")
+        print(f"Sizes: {sizes} | Memory increase: {memory_increase:>8} {unit} "
+              f"({memory_increase // len(sizes)} {unit} per request) | "
+              f"RSS increase: {rss_increase} KB")
 
         # Test rejected large request
         print("\nTesting rejected large request (11MB):")
-        baseline = tracemalloc.get_traced_memory()[0]
+        baseline = memory_snapshot(deep)
 
         headers = {"Content-Length": str(11 * 1024 * 1024)}
         response = await client.get("/health", headers=headers)
         assert response.status_code == 413
 
-        current = tracemalloc.get_traced_memory()[0]
-        memory_increase = current - baseline
+        memory_increase = memory_snapshot(deep) - baseline
 
-        print(f"Rejected 11MB request | Memory increase: {memory_increase:>8} bytes")
+        print(f"Rejected 11MB request | Memory increase: {memory_increase:>8} {unit}")
         print("✓ Large request was rejected without loading into memory")
 
-    tracemalloc.stop()
+    if deep:
+        tracemalloc.stop()
+
+
+@pytest.mark.asyncio
+async def test_memory_with_size_limits(deep: bool):
+    """Test that the size limit middleware doesn't cause memory issues."""
+    await check_memory_with_size_limits(deep)
 
 
 if __name__ == "__main__":
-    asyncio.run(test_memory_with_size_limits())
+    asyncio.run(check_memory_with_size_limits(deep="--deep" in sys.argv))
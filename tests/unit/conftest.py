@@ -0,0 +1,27 @@
+"""Shared fixtures for unit tests."""
+from unittest.mock import create_autospec
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Introspecting AsyncSession is the slow part, so it happens once per session
+_ASYNC_SESSION_MOCK = create_autospec(AsyncSession, instance=True)
+
+
+@pytest.fixture
+def mock_db():
+    """Return the shared autospec'd session, reset for this test."""
+    _ASYNC_SESSION_MOCK.reset_mock(return_value=True, side_effect=True)
+    return _ASYNC_SESSION_MOCK
+
+
+@pytest.fixture(scope="session")
+def duplicate_name_error() -> IntegrityError:
+    """Build the IntegrityError raised on a duplicate category name."""
+    # The third argument becomes ``error.orig``, which the service stringifies
+    return IntegrityError(
+        "duplicate key",
+        "INSERT/UPDATE categories",
+        "uq_user_category_name"
+    )
@@ -1,6 +1,8 @@
 """Tests for middleware registry."""
-from unittest.mock import Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock
 
+import pytest
 from fastapi import FastAPI
 
 from app.middleware.error_handler import ErrorHandlerMiddleware
@@ -14,6 +16,21 @@ from app.middleware.request import RequestSizeLimitMiddleware
 from app.middleware.security import SecurityHeadersMiddleware
 
 
+@pytest.fixture
+def mock_settings(monkeypatch):
+    """Replace the settings seen by the registry with plain attributes."""
+    settings = SimpleNamespace(
+        middleware_enabled=True,
+        metrics_collection_enabled=True,
+        security_headers_enabled=True,
+        max_request_size=10485760,  # 10MB
+        request_size_error_message="Request too large",
+        request_logging_enabled=True,
+    )
+    monkeypatch.setattr("app.middleware.registry.settings", settings)
+    return settings
+
+
 class TestMiddlewareConfig:
     """Test cases for MiddlewareConfig."""
 
@@ -65,11 +82,8 @@ class TestMiddlewareRegistry:
         assert registry.middleware_configs[0].middleware_class == SecurityHeadersMiddleware
         assert registry.middleware_configs[1].middleware_class == RequestSizeLimitMiddleware
 
-    @patch('app.config.settings')
     def test_apply_to_app_with_middleware_enabled(self, mock_settings):
         """Test applying middleware when enabled."""
-        mock_settings.middleware_enabled = True
-
         app = FastAPI()
         mock_add_middleware = Mock()
         app.add_middleware = mock_add_middleware
@@ -88,7 +102,6 @@ class TestMiddlewareRegistry:
             max_size=1024
         )
 
-    @patch('app.config.settings')
     def test_apply_to_app_with_middleware_disabled(self, mock_settings):
         """Test that middleware is not applied when globally disabled."""
         mock_settings.middleware_enabled = False
@@ -107,11 +120,8 @@ class TestMiddlewareRegistry:
 
         mock_add_middleware.assert_not_called()
 
-    @patch('app.config.settings')
     def test_apply_to_app_with_individual_middleware_disabled(self, mock_settings):
         """Test that individually disabled middleware is not applied."""
-        mock_settings.middleware_enabled = True
-
         app = FastAPI()
         mock_add_middleware = Mock()
         app.add_middleware = mock_add_middleware
@@ -127,11 +137,8 @@ class TestMiddlewareRegistry:
 
         mock_add_middleware.assert_not_called()
 
-    @patch('app.config.settings')
     def test_apply_to_app_reverse_order(self, mock_settings):
         """Test that middleware is applied in reverse order."""
-        mock_settings.middleware_enabled = True
-
         app = FastAPI()
         middleware_calls = []
 
@@ -163,20 +170,67 @@ class TestMiddlewareRegistry:
             ErrorHandlerMiddleware
         ]
 
+    def test_apply_to_app_reuses_plan_until_register(self, mock_settings):
+        """Test that the build plan is cached and rebuilt after a new register."""
+        registry = MiddlewareRegistry()
+        registry.register(MiddlewareConfig(
+            middleware_class=ErrorHandlerMiddleware,
+            order=10
+        ))
+
+        first_app = FastAPI()
+        first_app.add_middleware = Mock()
+        registry.apply_to_app(first_app)
+        plan = registry._frozen_plan
+
+        second_app = FastAPI()
+        second_app.add_middleware = Mock()
+        registry.apply_to_app(second_app)
+        assert registry._frozen_plan is plan
+        second_app.add_middleware.assert_called_once_with(ErrorHandlerMiddleware)
+
+        registry.register(MiddlewareConfig(
+            middleware_class=SecurityHeadersMiddleware,
+            order=20
+        ))
+        assert registry._frozen_plan is None
+
+        third_app = FastAPI()
+        third_app.add_middleware = Mock()
+        registry.apply_to_app(third_app)
+        assert third_app.add_middleware.call_count == 2
+
+    def test_apply_to_app_rebuilds_plan_when_enabled_flags_change(
+        self, mock_settings
+    ):
+        """Test that toggling an enabled flag is honoured on the next apply."""
+        config = MiddlewareConfig(
+            middleware_class=ErrorHandlerMiddleware,
+            order=10
+        )
+        registry = MiddlewareRegistry()
+        registry.register(config)
+        registry.apply_to_app(FastAPI())
+
+        config.enabled = False
+        app = FastAPI()
+        app.add_middleware = Mock()
+        registry.apply_to_app(app)
+        app.add_middleware.assert_not_called()
+
+        config.enabled = True
+        mock_settings.middleware_enabled = False
+        app = FastAPI()
+        app.add_middleware = Mock()
+        registry.apply_to_app(app)
+        app.add_middleware.assert_not_called()
+
 
 class TestCreateMiddlewareRegistry:
     """Test cases for create_middleware_registry factory function."""
 
-    @patch('app.config.settings')
     def test_create_middleware_registry(self, mock_settings):
         """Test creating a configured middleware registry."""
-        # Setup mock settings
-        mock_settings.metrics_collection_enabled = True
-        mock_settings.security_headers_enabled = True
-        mock_settings.max_request_size = 10485760  # 10MB
-        mock_settings.request_size_error_message = "Request too large"
-        mock_settings.request_logging_enabled = True
-
         registry = create_middleware_registry()
 
         assert isinstance(registry, MiddlewareRegistry)
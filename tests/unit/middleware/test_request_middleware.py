@@ -9,7 +9,7 @@ from app.middleware.request import RequestSizeLimitMiddleware
 class TestRequestSizeLimitMiddleware:
     """Test cases for RequestSizeLimitMiddleware."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def app_with_middleware(self):
         """Create app with request size limit middleware."""
         app = FastAPI()
@@ -26,9 +26,14 @@ class TestRequestSizeLimitMiddleware:
 
         return app
 
-    def test_request_within_limit(self, app_with_middleware):
+    @pytest.fixture(scope="class")
+    def client(self, app_with_middleware):
+        """Share one TestClient across the tests of this class."""
+        with TestClient(app_with_middleware) as client:
+            yield client
+
+    def test_request_within_limit(self, client):
         """Test request within size limit."""
-        client = TestClient(app_with_middleware)
         response = client.post(
             "/test",
             content=b"x" * 500,  # 500 bytes
@@ -37,9 +42,8 @@ class TestRequestSizeLimitMiddleware:
         assert response.status_code == 200
         assert response.json() == {"size": 500}
 
-    def test_request_exceeds_limit(self, app_with_middleware):
+    def test_request_exceeds_limit(self, client):
         """Test request exceeding size limit."""
-        client = TestClient(app_with_middleware)
         response = client.post(
             "/test",
             content=b"x" * 2000,  # 2KB
@@ -49,9 +53,8 @@ class TestRequestSizeLimitMiddleware:
         assert response.json()["detail"] == "Test: Request too large"
         assert response.json()["max_size_bytes"] == 1024
 
-    def test_invalid_content_length(self, app_with_middleware):
+    def test_invalid_content_length(self, client):
         """Test invalid Content-Length header."""
-        client = TestClient(app_with_middleware)
         response = client.post(
             "/test",
             content=b"test",
@@ -60,82 +63,55 @@ class TestRequestSizeLimitMiddleware:
         assert response.status_code == 400
         assert "Invalid Content-Length" in response.json()["detail"]
 
-    def test_no_content_length(self, app_with_middleware):
+    def test_no_content_length(self, client):
         """Test request without Content-Length header."""
-        client = TestClient(app_with_middleware)
         response = client.post("/test", json={"test": "data"})
         assert response.status_code == 200
 
-    def test_max_size_in_error_response(self):
-        """Test that max size is included in error response when configured."""
+    @pytest.mark.parametrize(
+        "middleware_config,payload_size,expected,excluded",
+        [
+            (
+                {"max_size": 2048, "include_max_size_in_error": True},
+                3000,
+                # 2KB = 0.002MB rounds to 0.0
+                {"max_size_bytes": 2048, "max_size_mb": 0.0},
+                (),
+            ),
+            (
+                {"max_size": 100, "error_message": "Custom error: Too big!"},
+                200,
+                {"detail": "Custom error: Too big!"},
+                (),
+            ),
+            (
+                {"max_size": 1024, "include_max_size_in_error": False},
+                2000,
+                {"detail": "Request body too large"},
+                ("max_size_bytes", "max_size_mb"),
+            ),
+        ],
+        ids=["max_size_in_error", "custom_error_message", "exclude_max_size"],
+    )
+    def test_error_response_configuration(
+        self, middleware_config, payload_size, expected, excluded
+    ):
+        """Test how the middleware options shape the 413 response."""
         app = FastAPI()
-        app.add_middleware(
-            RequestSizeLimitMiddleware,
-            max_size=2048,
-            include_max_size_in_error=True
-        )
+        app.add_middleware(RequestSizeLimitMiddleware, **middleware_config)
 
         @app.post("/test")
         async def test_endpoint():
             return {"status": "ok"}
 
-        client = TestClient(app)
-        response = client.post(
+        response = TestClient(app).post(
             "/test",
-            content=b"x" * 3000,
-            headers={"Content-Length": "3000"}
-        )
-
-        assert response.status_code == 413
-        json_response = response.json()
-        assert json_response["max_size_bytes"] == 2048
-        assert json_response["max_size_mb"] == 0.0  # 2KB = 0.002MB rounds to 0.0
-
-    def test_custom_error_message(self):
-        """Test custom error message configuration."""
-        app = FastAPI()
-        custom_message = "Custom error: Too big!"
-        app.add_middleware(
-            RequestSizeLimitMiddleware,
-            max_size=100,
-            error_message=custom_message
-        )
-
-        @app.post("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
-
-        client = TestClient(app)
-        response = client.post(
-            "/test",
-            content=b"x" * 200,
-            headers={"Content-Length": "200"}
-        )
-
-        assert response.status_code == 413
-        assert response.json()["detail"] == custom_message
-
-    def test_exclude_max_size_from_error(self):
-        """Test excluding max size from error response."""
-        app = FastAPI()
-        app.add_middleware(
-            RequestSizeLimitMiddleware,
-            max_size=1024,
-            include_max_size_in_error=False
-        )
-
-        @app.post("/test")
-        async def test_endpoint():
-            return {"status": "ok"}
-
-        client = TestClient(app)
-        response = client.post(
-            "/test",
-            content=b"x" * 2000,
-            headers={"Content-Length": "2000"}
+            content=b"x" * payload_size,
+            headers={"Content-Length": str(payload_size)}
         )
 
         assert response.status_code == 413
         json_response = response.json()
-        assert "max_size_bytes" not in json_response
-        assert "max_size_mb" not in json_response
+        assert json_response.items() >= expected.items()
+        for key in excluded:
+            assert key not in json_response
@@ -1,11 +1,11 @@
 """Unit tests for authentication service."""
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
 from jose import jwt
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
 from app.models.user import User
@@ -13,13 +13,19 @@ from app.schemas.user import UserCreate
 from app.services.auth import AuthService
 from app.utils.security import get_password_hash, verify_password
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+def _stub_result(value):
+    """Build a lightweight query result whose scalar_one_or_none returns ``value``."""
+    return SimpleNamespace(scalar_one_or_none=lambda: value)
 
 
 @pytest.fixture
 def mock_db():
-    """Create a mock database session."""
-    mock = AsyncMock(spec=AsyncSession)
+    """Create a mock database session with only the methods AuthService uses."""
+    mock = AsyncMock()
+    mock.execute = AsyncMock()
     mock.commit = AsyncMock()
     mock.refresh = AsyncMock()
     mock.add = MagicMock()
@@ -33,12 +39,30 @@ def auth_service(mock_db):
 
 
 @pytest.fixture
-def sample_user():
+def mock_blacklist(monkeypatch):
+    """Replace the token blacklist service with a mock at token version 1."""
+    mock = AsyncMock()
+    mock.get_user_token_version.return_value = 1
+    monkeypatch.setattr(
+        "app.services.token_blacklist.get_token_blacklist_service",
+        AsyncMock(return_value=mock),
+    )
+    return mock
+
+
+@pytest.fixture(scope="session")
+def _test_password_hash():
+    """Hash the sample password with bcrypt once per session."""
+    return get_password_hash("TestPassword123!")
+
+
+@pytest.fixture
+def sample_user(_test_password_hash):
     """Create a sample user."""
     return User(
         id=uuid4(),
         email="test@example.com",
-        password_hash=get_password_hash("TestPassword123!"),
+        password_hash=_test_password_hash,
         name="Test User",
         is_active=True,
     )
@@ -62,9 +86,7 @@ class TestAuthService:
     ):
         """Test successful user registration."""
         # Mock query result - no existing user
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(None)
 
         # Call the method
         result = await auth_service.register_user(sample_user_create)
@@ -93,9 +115,7 @@ class TestAuthService:
     ):
         """Test registration with duplicate email."""
         # Mock query result - existing user found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(sample_user)
 
         # Should raise ValueError
         with pytest.raises(ValueError, match="User with this email already exists"):
@@ -110,9 +130,7 @@ class TestAuthService:
     ):
         """Test successful user authentication."""
         # Mock query result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(sample_user)
 
         # Call the method
         result = await auth_service.authenticate_user(
@@ -127,9 +145,7 @@ class TestAuthService:
     ):
         """Test authentication with wrong password."""
         # Mock query result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(sample_user)
 
         # Call the method with wrong password
         result = await auth_service.authenticate_user(
@@ -142,9 +158,7 @@ class TestAuthService:
     async def test_authenticate_user_not_found(self, auth_service, mock_db):
         """Test authentication with non-existent user."""
         # Mock query result - no user found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(None)
 
         # Call the method
         result = await auth_service.authenticate_user(
@@ -162,9 +176,7 @@ class TestAuthService:
         sample_user.is_active = False
 
         # Mock query result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(sample_user)
 
         # Call the method
         result = await auth_service.authenticate_user(
@@ -174,33 +186,22 @@ class TestAuthService:
         # Verify result
         assert result is None
 
-    async def test_create_user_token(self, auth_service, sample_user):
+    async def test_create_user_token(self, auth_service, sample_user, mock_blacklist):
         """Test user token creation."""
-        # Mock token blacklist service
-        mock_blacklist = AsyncMock()
-        mock_blacklist.get_user_token_version.return_value = 1
-
-        with patch('app.services.token_blacklist.get_token_blacklist_service', return_value=mock_blacklist):
-            # Call the method
-            token, expires_in = await auth_service.create_user_token(sample_user.id)
-
-            # Verify token contains correct version
-            payload = jwt.decode(
-                token,
-                settings.secret_key.get_secret_value(),
-                algorithms=[settings.algorithm]
-            )
-            assert payload["sub"] == str(sample_user.id)
-            assert payload["token_version"] == 1
-            assert "exp" in payload
-            assert expires_in == settings.access_token_expire_minutes * 60
+        # Call the method
+        token, expires_in = await auth_service.create_user_token(sample_user.id)
+
+        # Verify token contains correct version
+        payload = jwt.get_unverified_claims(token)
+        assert payload["sub"] == str(sample_user.id)
+        assert payload["token_version"] == 1
+        assert "exp" in payload
+        assert expires_in == settings.access_token_expire_minutes * 60
 
     async def test_get_user_by_id_success(self, auth_service, mock_db, sample_user):
         """Test getting user by ID."""
         # Mock query result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = sample_user
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(sample_user)
 
         # Call the method
         result = await auth_service.get_user_by_id(sample_user.id)
@@ -211,9 +212,7 @@ class TestAuthService:
     async def test_get_user_by_id_not_found(self, auth_service, mock_db):
         """Test getting non-existent user by ID."""
         # Mock query result - no user found
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(None)
 
         # Call the method
         result = await auth_service.get_user_by_id(uuid4())
@@ -226,9 +225,7 @@ class TestAuthService:
     ):
         """Test user registration with database error."""
         # Mock query result - no existing user
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute.return_value = mock_result
+        mock_db.execute.return_value = _stub_result(None)
 
         # Mock database error on commit
         mock_db.commit.side_effect = IntegrityError("", "", "")
@@ -1,7 +1,7 @@
 """Unit tests for cache service."""
-import json
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, call, patch
 
+import orjson
 import pytest
 import redis.asyncio as redis
 from redis.exceptions import RedisError
@@ -9,6 +9,22 @@ from redis.exceptions import RedisError
 from app.services.cache import CacheService
 
 
+class _AsyncIter:
+    """Async iterator over a fixed tuple, standing in for ``scan_iter``."""
+
+    def __init__(self, items: tuple):
+        self._items = iter(items)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._items)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
 @pytest.fixture
 def mock_redis():
     """Create a mock Redis client."""
@@ -27,12 +43,17 @@ def cache_service(mock_redis):
     return CacheService(redis_client=mock_redis)
 
 
-@pytest.mark.asyncio
+@pytest.fixture(scope="module")
+def bare_cache():
+    """Share a Redis-less cache service for the pure key helper tests."""
+    return CacheService()
+
+
 async def test_get_cached_value(cache_service, mock_redis):
     """Test retrieving a cached value."""
     # Setup
     test_data = {"id": "123", "name": "Test"}
-    mock_redis.get.return_value = json.dumps(test_data)
+    mock_redis.get.return_value = orjson.dumps(test_data)
 
     # Execute
     result = await cache_service.get("todos", "test_key")
@@ -42,7 +63,6 @@ async def test_get_cached_value(cache_service, mock_redis):
     mock_redis.get.assert_called_once_with("cache:todos:test_key")
 
 
-@pytest.mark.asyncio
 async def test_get_cache_miss(cache_service, mock_redis):
     """Test cache miss returns None."""
     # Setup
@@ -56,7 +76,6 @@ async def test_get_cache_miss(cache_service, mock_redis):
     mock_redis.get.assert_called_once_with("cache:todos:missing_key")
 
 
-@pytest.mark.asyncio
 async def test_get_with_redis_error(cache_service, mock_redis):
     """Test get handles Redis errors gracefully."""
     # Setup
@@ -69,7 +88,6 @@ async def test_get_with_redis_error(cache_service, mock_redis):
     assert result is None  # Should return None on error
 
 
-@pytest.mark.asyncio
 async def test_set_cached_value(cache_service, mock_redis):
     """Test setting a value in cache."""
     # Setup
@@ -83,11 +101,10 @@ async def test_set_cached_value(cache_service, mock_redis):
     mock_redis.setex.assert_called_once_with(
         "cache:todos:test_key",
         600,
-        json.dumps(test_data)
+        orjson.dumps(test_data)
     )
 
 
-@pytest.mark.asyncio
 async def test_set_with_redis_error(cache_service, mock_redis):
     """Test set handles Redis errors gracefully."""
     # Setup
@@ -100,7 +117,6 @@ async def test_set_with_redis_error(cache_service, mock_redis):
     assert result is False  # Should return False on error
 
 
-@pytest.mark.asyncio
 async def test_delete_cached_value(cache_service, mock_redis):
     """Test deleting a cached value."""
     # Setup
@@ -114,15 +130,13 @@ async def test_delete_cached_value(cache_service, mock_redis):
     mock_redis.delete.assert_called_once_with("cache:todos:test_key")
 
 
-@pytest.mark.asyncio
 async def test_delete_pattern(cache_service, mock_redis):
     """Test deleting values by pattern."""
     # Setup
-    async def async_generator():
-        yield "cache:todos:user:123:get_todos"
-        yield "cache:todos:user:123:get_todo"
-
-    mock_redis.scan_iter.return_value = async_generator()
+    mock_redis.scan_iter.return_value = _AsyncIter((
+        "cache:todos:user:123:get_todos",
+        "cache:todos:user:123:get_todo",
+    ))
     mock_redis.delete.return_value = 2
 
     # Execute
@@ -137,80 +151,85 @@ async def test_delete_pattern(cache_service, mock_redis):
     )
 
 
-@pytest.mark.asyncio
-async def test_invalidate_user_cache(cache_service):
+async def test_invalidate_user_cache(cache_service, mock_redis):
     """Test invalidating all cache for a user."""
     # Setup
-    with patch.object(cache_service, 'delete_pattern') as mock_delete:
-        # Execute
-        await cache_service.invalidate_user_cache("user123")
-
-        # Verify
-        assert mock_delete.call_count == 3
-        mock_delete.assert_any_call("todos", "user:user123:*")
-        mock_delete.assert_any_call("categories", "user:user123:*")
-        mock_delete.assert_any_call("user", "user123:*")
+    mock_redis.scan_iter.return_value = _AsyncIter((
+        "cache:todos:user:user123:get_todos",
+        "cache:categories:user:user123:get_categories",
+        "cache:user:user123:profile",
+        "cache:todos:other:user123:unrelated",
+    ))
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[1, 1, 1])
+    mock_redis.pipeline = MagicMock(return_value=pipe)
 
+    # Execute
+    await cache_service.invalidate_user_cache("user123")
 
-@pytest.mark.asyncio
-async def test_get_or_set_cache_hit(cache_service):
+    # Verify
+    assert mock_redis.scan_iter.call_count == 1
+    mock_redis.scan_iter.assert_called_once_with(match="cache:*user123:*")
+    assert pipe.delete.call_args_list == [
+        call("cache:todos:user:user123:get_todos"),
+        call("cache:categories:user:user123:get_categories"),
+        call("cache:user:user123:profile"),
+    ]
+    pipe.execute.assert_awaited_once()
+    mock_redis.delete.assert_not_called()
+
+
+async def test_get_or_set_cache_hit(cache_service, monkeypatch):
     """Test get_or_set with cache hit."""
     # Setup
     cached_data = {"cached": True}
     factory = AsyncMock(return_value={"fresh": True})
+    monkeypatch.setattr(cache_service, "get", AsyncMock(return_value=cached_data))
 
-    with patch.object(cache_service, 'get', return_value=cached_data):
-        # Execute
-        result = await cache_service.get_or_set("todos", "key", factory, ttl=300)
+    # Execute
+    result = await cache_service.get_or_set("todos", "key", factory, ttl=300)
 
-        # Verify
-        assert result == cached_data
-        factory.assert_not_called()  # Factory should not be called on cache hit
+    # Verify
+    assert result == cached_data
+    factory.assert_not_called()  # Factory should not be called on cache hit
 
 
-@pytest.mark.asyncio
-async def test_get_or_set_cache_miss(cache_service):
+async def test_get_or_set_cache_miss(cache_service, monkeypatch):
     """Test get_or_set with cache miss."""
     # Setup
     fresh_data = {"fresh": True}
     factory = AsyncMock(return_value=fresh_data)
+    mock_set = AsyncMock()
+    monkeypatch.setattr(cache_service, "get", AsyncMock(return_value=None))
+    monkeypatch.setattr(cache_service, "set", mock_set)
 
-    with patch.object(cache_service, 'get', return_value=None):
-        with patch.object(cache_service, 'set') as mock_set:
-            # Execute
-            result = await cache_service.get_or_set("todos", "key", factory, ttl=300)
+    # Execute
+    result = await cache_service.get_or_set("todos", "key", factory, ttl=300)
 
-            # Verify
-            assert result == fresh_data
-            factory.assert_called_once()
-            mock_set.assert_called_once_with("todos", "key", fresh_data, 300)
+    # Verify
+    assert result == fresh_data
+    factory.assert_called_once()
+    mock_set.assert_called_once_with("todos", "key", fresh_data, 300)
 
 
-@pytest.mark.asyncio
-async def test_make_key():
+def test_make_key(bare_cache):
     """Test cache key generation."""
-    service = CacheService()
-
-    key = service._make_key("todos", "user:123:get_todos")
+    key = bare_cache._make_key("todos", "user:123:get_todos")
     assert key == "cache:todos:user:123:get_todos"
 
 
-@pytest.mark.asyncio
-async def test_hash_dict():
+def test_hash_dict(bare_cache):
     """Test dictionary hashing for cache keys."""
-    service = CacheService()
-
     # Same content, different order should produce same hash
     dict1 = {"b": 2, "a": 1, "c": 3}
     dict2 = {"a": 1, "c": 3, "b": 2}
 
-    hash1 = service._hash_dict(dict1)
-    hash2 = service._hash_dict(dict2)
+    hash1 = bare_cache._hash_dict(dict1)
+    hash2 = bare_cache._hash_dict(dict2)
 
     assert hash1 == hash2
-    assert len(hash1) == 32  # MD5 hash length
+    assert len(hash1) == 32
 
-@pytest.mark.asyncio
 @patch('app.services.cache.get_redis_client')
 async def test_cache_service_uses_configured_db(mock_get_redis_client):
     """Test that CacheService uses the redis_cache_db from settings."""
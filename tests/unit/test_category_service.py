@@ -1,23 +1,32 @@
 """Unit tests for CategoryService."""
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
-from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
 from app.services.category import CategoryService
 
-pytestmark = pytest.mark.asyncio
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+class FakeAsyncSession:
+    """Lightweight stand-in exposing only the session methods the service uses."""
+
+    def __init__(self):
+        self.add = MagicMock()
+        self.delete = AsyncMock()
+        self.commit = AsyncMock()
+        self.rollback = AsyncMock()
+        self.refresh = AsyncMock()
+        self.execute = AsyncMock()
 
 
 @pytest.fixture
 def mock_db():
     """Create a mock database session."""
-    mock = AsyncMock(spec=AsyncSession)
-    return mock
+    return FakeAsyncSession()
 
 
 @pytest.fixture
@@ -26,9 +35,12 @@ def category_service(mock_db):
     return CategoryService(mock_db)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_category():
-    """Create a sample category."""
+    """Create a sample category shared by the whole session.
+
+    Tests that let the service mutate it must work on ``fresh_copy`` instead.
+    """
     return Category(
         id=uuid4(),
         user_id=uuid4(),
@@ -37,13 +49,33 @@ def sample_category():
     )
 
 
+def fresh_copy(category: Category) -> Category:
+    """Build an independent ORM instance with the same column values."""
+    return Category(
+        id=category.id,
+        user_id=category.user_id,
+        name=category.name,
+        color=category.color,
+    )
+
+
 @pytest.fixture
+def stub_get_category(category_service, monkeypatch):
+    """Return a helper that makes ``get_category`` resolve to a given value."""
+    def stub(category: Category | None) -> None:
+        monkeypatch.setattr(
+            category_service, "get_category", AsyncMock(return_value=category)
+        )
+    return stub
+
+
+@pytest.fixture(scope="session")
 def sample_category_create():
     """Create a sample CategoryCreate schema."""
     return CategoryCreate(name="Work", color="#FF5733")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_category_update():
     """Create a sample CategoryUpdate schema."""
     return CategoryUpdate(name="Personal", color="#00FF00")
@@ -59,9 +91,6 @@ class TestCategoryService:
         user_id = uuid4()
 
         # Mock the database operations
-        mock_db.add = MagicMock()
-        mock_db.commit = AsyncMock()
-        mock_db.refresh = AsyncMock()
 
         # Call the method
         result = await category_service.create_category(user_id, sample_category_create)
@@ -75,29 +104,13 @@ class TestCategoryService:
         mock_db.refresh.assert_called_once()
 
     async def test_create_category_duplicate_name(
-        self, category_service, mock_db, sample_category_create
+        self, category_service, mock_db, sample_category_create, duplicate_name_error
     ) -> None:
         """Test category creation with duplicate name."""
         user_id = uuid4()
 
         # Mock IntegrityError for duplicate name
-        mock_db.add = MagicMock()
-        mock_db.commit = AsyncMock(side_effect=IntegrityError(
-            "duplicate key",
-            "INSERT INTO categories",
-            "uq_user_category_name"
-        ))
-        mock_db.rollback = AsyncMock()
-
-        # Create mock IntegrityError with orig attribute
-        error = IntegrityError(
-            "duplicate key",
-            "INSERT INTO categories",
-            "uq_user_category_name"
-        )
-        error.orig = MagicMock()
-        error.orig.__str__ = MagicMock(return_value="uq_user_category_name")
-        mock_db.commit.side_effect = error
+        mock_db.commit.side_effect = duplicate_name_error
 
         # Call the method and expect ValueError
         with pytest.raises(
@@ -119,7 +132,7 @@ class TestCategoryService:
         # Mock the database query
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = sample_category
-        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.execute.return_value = mock_result
 
         # Call the method
         result = await category_service.get_category(category_id, user_id)
@@ -138,7 +151,7 @@ class TestCategoryService:
         # Mock the database query
         mock_result = MagicMock()
         mock_result.scalar_one_or_none.return_value = None
-        mock_db.execute = AsyncMock(return_value=mock_result)
+        mock_db.execute.return_value = mock_result
 
         # Call the method
         result = await category_service.get_category(category_id, user_id)
@@ -160,9 +173,7 @@ class TestCategoryService:
         mock_categories_result = MagicMock()
         mock_categories_result.scalars.return_value.all.return_value = [sample_category]
 
-        mock_db.execute = AsyncMock(
-            side_effect=[mock_count_result, mock_categories_result]
-        )
+        mock_db.execute.side_effect = [mock_count_result, mock_categories_result]
 
         # Call the method
         categories, total = await category_service.get_categories(
@@ -181,112 +192,108 @@ class TestCategoryService:
         assert mock_db.execute.call_count == 2
 
     async def test_update_category_success(
-        self, category_service, mock_db, sample_category, sample_category_update
+        self,
+        category_service,
+        mock_db,
+        sample_category,
+        sample_category_update,
+        stub_get_category,
     ) -> None:
         """Test successful category update."""
         category_id = sample_category.id
         user_id = sample_category.user_id
 
-        # Mock get_category to return the existing category
-        with patch.object(
-            category_service, 'get_category', return_value=sample_category
-        ):
-            mock_db.commit = AsyncMock()
-            mock_db.refresh = AsyncMock()
+        # Mock get_category to return a copy the update may mutate
+        stub_get_category(fresh_copy(sample_category))
 
-            # Call the method
-            result = await category_service.update_category(
-                category_id, user_id, sample_category_update
-            )
+        # Call the method
+        result = await category_service.update_category(
+            category_id, user_id, sample_category_update
+        )
 
-            # Assertions
-            assert result.name == sample_category_update.name
-            assert result.color == sample_category_update.color
-            mock_db.commit.assert_called_once()
-            mock_db.refresh.assert_called_once()
+        # Assertions
+        assert result.name == sample_category_update.name
+        assert result.color == sample_category_update.color
+        mock_db.commit.assert_called_once()
+        mock_db.refresh.assert_called_once()
 
     async def test_update_category_not_found(
-        self, category_service, mock_db, sample_category_update
+        self, category_service, mock_db, sample_category_update, stub_get_category
     ) -> None:
         """Test updating a non-existent category."""
         category_id = uuid4()
         user_id = uuid4()
 
         # Mock get_category to return None
-        with patch.object(category_service, 'get_category', return_value=None):
-            # Call the method
-            result = await category_service.update_category(
-                category_id, user_id, sample_category_update
-            )
+        stub_get_category(None)
 
-            # Assertions
-            assert result is None
+        # Call the method
+        result = await category_service.update_category(
+            category_id, user_id, sample_category_update
+        )
+
+        # Assertions
+        assert result is None
 
     async def test_update_category_duplicate_name(
-        self, category_service, mock_db, sample_category, sample_category_update
+        self,
+        category_service,
+        mock_db,
+        sample_category,
+        sample_category_update,
+        duplicate_name_error,
+        stub_get_category,
     ) -> None:
         """Test category update with duplicate name."""
         category_id = sample_category.id
         user_id = sample_category.user_id
 
-        # Mock get_category to return the existing category
-        with patch.object(
-            category_service, 'get_category', return_value=sample_category
+        # Mock get_category to return a copy the update may mutate
+        stub_get_category(fresh_copy(sample_category))
+
+        # Mock IntegrityError for duplicate name
+        mock_db.commit.side_effect = duplicate_name_error
+
+        # Call the method and expect ValueError
+        with pytest.raises(
+            ValueError, match="A category with this name already exists"
         ):
-            # Mock IntegrityError for duplicate name
-            error = IntegrityError(
-                "duplicate key",
-                "UPDATE categories",
-                "uq_user_category_name"
+            await category_service.update_category(
+                category_id, user_id, sample_category_update
             )
-            error.orig = MagicMock()
-            error.orig.__str__ = MagicMock(return_value="uq_user_category_name")
-            mock_db.commit = AsyncMock(side_effect=error)
-            mock_db.rollback = AsyncMock()
-
-            # Call the method and expect ValueError
-            with pytest.raises(
-                ValueError, match="A category with this name already exists"
-            ):
-                await category_service.update_category(
-                    category_id, user_id, sample_category_update
-                )
 
-            mock_db.rollback.assert_called_once()
+        mock_db.rollback.assert_called_once()
 
     async def test_delete_category_success(
-        self, category_service, mock_db, sample_category
+        self, category_service, mock_db, sample_category, stub_get_category
     ) -> None:
         """Test successful category deletion."""
         category_id = sample_category.id
         user_id = sample_category.user_id
 
         # Mock get_category to return the existing category
-        with patch.object(
-            category_service, 'get_category', return_value=sample_category
-        ):
-            mock_db.delete = AsyncMock()
-            mock_db.commit = AsyncMock()
+        stub_get_category(sample_category)
 
-            # Call the method
-            result = await category_service.delete_category(category_id, user_id)
+        # Call the method
+        result = await category_service.delete_category(category_id, user_id)
 
-            # Assertions
-            assert result is True
-            mock_db.delete.assert_called_once_with(sample_category)
-            mock_db.commit.assert_called_once()
+        # Assertions
+        assert result is True
+        mock_db.delete.assert_called_once_with(sample_category)
+        mock_db.commit.assert_called_once()
 
     async def test_delete_category_not_found(
-        self, category_service, mock_db
+        self, category_service, mock_db, stub_get_category
     ) -> None:
         """Test deleting a non-existent category."""
         category_id = uuid4()
         user_id = uuid4()
 
         # Mock get_category to return None
-        with patch.object(category_service, 'get_category', return_value=None):
-            # Call the method
-            result = await category_service.delete_category(category_id, user_id)
+        stub_get_category(None)
 
-            # Assertions
-            assert result is False
+        # Call the method
+        result = await category_service.delete_category(category_id, user_id)
+
+        # Assertions
+        assert result is False
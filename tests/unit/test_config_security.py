@@ -1,31 +1,33 @@
 """Unit tests for configuration security validation."""
-import os
-from unittest.mock import patch
+import secrets
+from unittest.mock import NonCallableMagicMock, patch
 
 import pytest
 from pydantic import SecretStr, ValidationError
 
 from app.config import Settings
+from app.main import verify_production_config
+
+# Generated once per module rather than once per test
+_VALID_KEY = secrets.token_urlsafe(64)
+_PROD_VALID = SecretStr("valid_key_64_chars" * 4)
 
 
 class TestSecretKeyValidation:
     """Test cases for SECRET_KEY validation."""
 
     def test_production_requires_secret_key(self):
-        """Production must fail without SECRET_KEY when set via environment."""
-        # The field validator checks os.getenv, not the instance field
-        with patch.dict(os.environ, {"ENVIRONMENT": "production"}, clear=True):
-            with pytest.raises(ValueError) as exc_info:
-                Settings(environment="production", secret_key=None)
+        """Production must fail without SECRET_KEY."""
+        with pytest.raises(ValueError) as exc_info:
+            Settings(environment="production", secret_key=None)
 
-            assert "SECRET_KEY is required in production" in str(exc_info.value)
+        assert "SECRET_KEY is required in production" in str(exc_info.value)
 
     def test_development_generates_warning(self, caplog):
         """Development should warn but continue."""
-        with patch.dict(os.environ, {"ENVIRONMENT": "development"}, clear=True):
-            settings = Settings(environment="development", secret_key=None)
-            assert settings.secret_key is not None
-            assert "No SECRET_KEY set - generating temporary key" in caplog.text
+        settings = Settings(environment="development", secret_key=None)
+        assert settings.secret_key is not None
+        assert "No SECRET_KEY set - generating temporary key" in caplog.text
 
     def test_secret_key_minimum_length(self):
         """SECRET_KEY must be at least 64 characters."""
@@ -35,37 +37,40 @@ class TestSecretKeyValidation:
         errors = exc_info.value.errors()
         assert any("at least 64 characters long" in str(error) for error in errors)
 
-    def test_secret_key_weak_patterns(self):
+    @pytest.mark.parametrize("weak_key", [
+        "a" * 64,  # Only letters (low entropy)
+        "1" * 64,  # Only numbers (low entropy)
+        "x" * 64,  # Repeating characters (low entropy)
+        "abcdef123456" * 6,  # Repetitive pattern, low entropy
+        # Contains 'secret'
+        "secretsecretsecretsecretsecretsecretsecretsecretsecretsecret123",
+        # Contains 'password'
+        "passwordpasswordpasswordpasswordpasswordpasswordpasswordpass123",
+    ], ids=[
+        "only_letters",
+        "only_numbers",
+        "repeating_char",
+        "repetitive_pattern",
+        "contains_secret",
+        "contains_password",
+    ])
+    def test_secret_key_weak_patterns(self, weak_key):
         """SECRET_KEY must not contain weak patterns."""
-        weak_keys = [
-            "a" * 64,  # Only letters (low entropy)
-            "1" * 64,  # Only numbers (low entropy)
-            "x" * 64,  # Repeating characters (low entropy)
-            "abcdef123456" * 6,  # Repetitive pattern, low entropy
-            # Contains 'secret'
-            "secretsecretsecretsecretsecretsecretsecretsecretsecretsecret123",
-            # Contains 'password'
-            "passwordpasswordpasswordpasswordpasswordpasswordpasswordpass123",
-        ]
-
-        for weak_key in weak_keys:
-            with pytest.raises(ValidationError) as exc_info:
-                Settings(secret_key=SecretStr(weak_key))
-
-            # Check for either length, pattern, or entropy error
-            error_str = str(exc_info.value)
-            assert (
-                "weak patterns" in error_str
-                or "at least 64 characters" in error_str
-                or "lacks sufficient complexity" in error_str
-            )
+        with pytest.raises(ValidationError) as exc_info:
+            Settings(secret_key=SecretStr(weak_key))
+
+        # Check for either length, pattern, or entropy error
+        error_str = str(exc_info.value)
+        assert (
+            "weak patterns" in error_str
+            or "at least 64 characters" in error_str
+            or "lacks sufficient complexity" in error_str
+        )
 
     def test_valid_secret_key(self):
         """Valid SECRET_KEY should pass validation."""
-        import secrets
-        valid_key = secrets.token_urlsafe(64)
-        settings = Settings(secret_key=SecretStr(valid_key))
-        assert settings.secret_key.get_secret_value() == valid_key
+        settings = Settings(secret_key=SecretStr(_VALID_KEY))
+        assert settings.secret_key.get_secret_value() == _VALID_KEY
 
     def test_environment_default_is_development(self):
         """Default environment should be development."""
@@ -75,48 +80,29 @@ class TestSecretKeyValidation:
 
     def test_production_with_valid_key(self):
         """Production with valid key should work."""
-        import secrets
-        valid_key = secrets.token_urlsafe(64)
         settings = Settings(
             environment="production",
-            secret_key=SecretStr(valid_key)
+            secret_key=SecretStr(_VALID_KEY)
         )
         assert settings.environment == "production"
-        assert settings.secret_key.get_secret_value() == valid_key
+        assert settings.secret_key.get_secret_value() == _VALID_KEY
 
 
 class TestProductionConfigValidation:
     """Test cases for production configuration validation."""
 
-    def test_verify_production_config_missing_secret(self):
-        """Production config should fail with missing SECRET_KEY."""
-        from app.main import verify_production_config
-
-        with patch('app.main.settings') as mock_settings:
-            mock_settings.secret_key = None
-            mock_settings.database_url = "postgresql://..."
-            mock_settings.backend_cors_origins = ["http://example.com"]
-
-            assert verify_production_config() is False
-
-    def test_verify_production_config_wildcard_cors(self):
-        """Production config should fail with wildcard CORS."""
-        from app.main import verify_production_config
-
-        with patch('app.main.settings') as mock_settings:
-            mock_settings.secret_key = SecretStr("valid_key_64_chars" * 4)
-            mock_settings.database_url = "postgresql://..."
-            mock_settings.backend_cors_origins = ["*"]
-
-            assert verify_production_config() is False
-
-    def test_verify_production_config_valid(self):
-        """Production config should pass with all valid settings."""
-        from app.main import verify_production_config
-
-        with patch('app.main.settings') as mock_settings:
-            mock_settings.secret_key = SecretStr("valid_key_64_chars" * 4)
+    @pytest.mark.parametrize("secret_key,cors_origins,expected", [
+        (None, ["http://example.com"], False),
+        (_PROD_VALID, ["*"], False),
+        (_PROD_VALID, ["http://example.com"], True),
+    ], ids=["missing_secret", "wildcard_cors", "valid"])
+    def test_verify_production_config(self, secret_key, cors_origins, expected):
+        """Production config should fail on a missing key or wildcard CORS."""
+        with patch(
+            'app.main.settings', new_callable=NonCallableMagicMock
+        ) as mock_settings:
+            mock_settings.secret_key = secret_key
             mock_settings.database_url = "postgresql://..."
-            mock_settings.backend_cors_origins = ["http://example.com"]
+            mock_settings.backend_cors_origins = cors_origins
 
-            assert verify_production_config() is True
+            assert verify_production_config() is expected
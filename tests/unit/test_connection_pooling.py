@@ -2,7 +2,7 @@
 
 import pytest
 
-from app.database import engine
+from app.database import async_session_maker, engine
 from app.redis import close_redis_pools, get_redis_pool
 
 
@@ -23,6 +23,19 @@ class TestDatabaseConnectionPooling:
         # in integration tests with a real database connection
 
 
+class TestDatabaseConfig:
+    """Test database session configuration."""
+
+    def test_async_session_configuration(self):
+        """Test that async session maker is properly configured."""
+        # Check session configuration
+        assert async_session_maker is not None
+        assert hasattr(async_session_maker, 'kw'), (
+            "Session maker should have kw attribute"
+        )
+        assert async_session_maker.kw.get("expire_on_commit") is False
+
+
 class TestRedisConnectionPooling:
     """Test Redis connection pooling configuration."""
 
@@ -51,13 +64,9 @@ class TestRedisConnectionPooling:
             pools[db] = get_redis_pool(db)
 
         # All pools should be different instances
-        pool_instances = list(pools.values())
-        for i, pool1 in enumerate(pool_instances):
-            for j, pool2 in enumerate(pool_instances):
-                if i != j:
-                    assert pool1 is not pool2
+        pool_ids = {id(pool) for pool in pools.values()}
+        assert len(pool_ids) == len(pools)
 
-    @pytest.mark.asyncio
     async def test_redis_pool_cleanup(self):
         """Test that Redis pools cleanup doesn't error."""
         # Create some pools
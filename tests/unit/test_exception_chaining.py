@@ -1,5 +1,6 @@
 """Test exception chaining for proper error handling."""
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
@@ -14,84 +15,63 @@ from app.services.category import CategoryService
 class TestExceptionChaining:
     """Test that exceptions properly chain with 'from' clause."""
 
-    @pytest.mark.asyncio
-    async def test_create_category_exception_chaining_api(self) -> None:
-        """Test that API layer properly chains exceptions."""
-        # Mock dependencies
-        mock_user = str(uuid4())
-        mock_db = AsyncMock()
-        category_data = CategoryCreate(name="Test", color="#FF0000")
-
-        # Create a mock service that raises ValueError
-        mock_service = AsyncMock()
-        mock_service.create_category.side_effect = ValueError(
-            "A category with this name already exists"
+    @pytest.mark.parametrize("endpoint,service_method,args", [
+        (
+            create_category,
+            "create_category",
+            (CategoryCreate(name="Test", color="#FF0000"),),
+        ),
+        (
+            update_category,
+            "update_category",
+            (uuid4(), CategoryUpdate(name="Updated")),
+        ),
+    ], ids=["create", "update"])
+    async def test_category_exception_chaining_api(
+        self, monkeypatch, endpoint, service_method, args
+    ) -> None:
+        """Test that the API layer properly chains service ValueErrors."""
+        message = "A category with this name already exists"
+        service = SimpleNamespace(
+            **{service_method: AsyncMock(side_effect=ValueError(message))}
         )
+        monkeypatch.setattr("app.api.categories.CategoryService", lambda db: service)
 
-        with patch('app.api.categories.CategoryService', return_value=mock_service):
-            try:
-                await create_category(category_data, mock_user, mock_db)
-            except HTTPException as e:
-                # Check that the exception was raised with proper chaining
-                assert e.__cause__ is not None
-                assert isinstance(e.__cause__, ValueError)
-                assert str(e.__cause__) == "A category with this name already exists"
-
-    @pytest.mark.asyncio
-    async def test_update_category_exception_chaining_api(self) -> None:
-        """Test that update API endpoint properly chains exceptions."""
-        # Mock dependencies
-        mock_user = str(uuid4())
-        mock_db = AsyncMock()
-        category_id = uuid4()
-        category_update = CategoryUpdate(name="Updated")
+        # Call past the rate limit decorator; only error handling is under test
+        with pytest.raises(HTTPException) as exc_info:
+            await endpoint.__wrapped__(MagicMock(), *args, str(uuid4()), AsyncMock())
 
-        # Create a mock service that raises ValueError
-        mock_service = AsyncMock()
-        mock_service.update_category.side_effect = ValueError(
-            "A category with this name already exists"
-        )
+        e = exc_info.value
+        # Check that the exception was raised with proper chaining
+        assert e.__cause__ is not None
+        assert isinstance(e.__cause__, ValueError)
+        assert str(e.__cause__) == message
 
-        with patch('app.api.categories.CategoryService', return_value=mock_service):
-            try:
-                await update_category(category_id, category_update, mock_user, mock_db)
-            except HTTPException as e:
-                # Check that the exception was raised with proper chaining
-                assert e.__cause__ is not None
-                assert isinstance(e.__cause__, ValueError)
-                assert str(e.__cause__) == "A category with this name already exists"
-
-    @pytest.mark.asyncio
-    async def test_create_category_exception_chaining_service(self) -> None:
+    async def test_create_category_exception_chaining_service(
+        self, duplicate_name_error
+    ) -> None:
         """Test that service layer properly chains IntegrityError."""
         mock_db = AsyncMock()
         service = CategoryService(mock_db)
         user_id = uuid4()
         category_data = CategoryCreate(name="Test", color="#FF0000")
 
-        # Mock IntegrityError
-        error = IntegrityError(
-            "duplicate key",
-            "INSERT INTO categories",
-            "uq_user_category_name"
-        )
-        error.orig = MagicMock()
-        error.orig.__str__ = MagicMock(return_value="uq_user_category_name")
-
         mock_db.add = MagicMock()
-        mock_db.commit = AsyncMock(side_effect=error)
+        mock_db.commit = AsyncMock(side_effect=duplicate_name_error)
         mock_db.rollback = AsyncMock()
 
-        try:
+        with pytest.raises(ValueError) as exc_info:
             await service.create_category(user_id, category_data)
-        except ValueError as e:
-            # Check that the exception was raised with proper chaining
-            assert e.__cause__ is not None
-            assert isinstance(e.__cause__, IntegrityError)
-            assert "uq_user_category_name" in str(e.__cause__.orig)
-
-    @pytest.mark.asyncio
-    async def test_update_category_exception_chaining_service(self) -> None:
+
+        e = exc_info.value
+        # Check that the exception was raised with proper chaining
+        assert e.__cause__ is not None
+        assert isinstance(e.__cause__, IntegrityError)
+        assert "uq_user_category_name" in str(e.__cause__.orig)
+
+    async def test_update_category_exception_chaining_service(
+        self, duplicate_name_error
+    ) -> None:
         """Test that update service method properly chains IntegrityError."""
         mock_db = AsyncMock()
         service = CategoryService(mock_db)
@@ -104,23 +84,16 @@ class TestExceptionChaining:
         mock_category.id = category_id
         mock_category.user_id = user_id
 
-        # Mock IntegrityError
-        error = IntegrityError(
-            "duplicate key",
-            "UPDATE categories",
-            "uq_user_category_name"
-        )
-        error.orig = MagicMock()
-        error.orig.__str__ = MagicMock(return_value="uq_user_category_name")
-
-        with patch.object(service, 'get_category', return_value=mock_category):
-            mock_db.commit = AsyncMock(side_effect=error)
-            mock_db.rollback = AsyncMock()
-
-            try:
-                await service.update_category(category_id, user_id, category_update)
-            except ValueError as e:
-                # Check that the exception was raised with proper chaining
-                assert e.__cause__ is not None
-                assert isinstance(e.__cause__, IntegrityError)
-                assert "uq_user_category_name" in str(e.__cause__.orig)
+        # The service is local to this test, so no restore is needed
+        service.get_category = AsyncMock(return_value=mock_category)
+        mock_db.commit = AsyncMock(side_effect=duplicate_name_error)
+        mock_db.rollback = AsyncMock()
+
+        with pytest.raises(ValueError) as exc_info:
+            await service.update_category(category_id, user_id, category_update)
+
+        e = exc_info.value
+        # Check that the exception was raised with proper chaining
+        assert e.__cause__ is not None
+        assert isinstance(e.__cause__, IntegrityError)
+        assert "uq_user_category_name" in str(e.__cause__.orig)
@@ -1,7 +1,7 @@
 """Unit tests for login rate limiting service."""
 
-from datetime import datetime, timedelta
-from unittest.mock import AsyncMock
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 import redis.asyncio as redis
@@ -10,24 +10,45 @@ from freezegun import freeze_time
 from app.services.login_rate_limit import LoginRateLimitService
 
 
+def epoch(dt: datetime) -> str:
+    """Encode a naive UTC datetime the way lockouts are stored in Redis."""
+    return str(int(dt.replace(tzinfo=UTC).timestamp()))
+
+
+@pytest.fixture
+def attempt_script():
+    """Create a mock of the record-attempt Lua script.
+
+    It returns ``[attempts, locked_until]`` like the real script.
+    """
+    return AsyncMock(return_value=[1, None])
+
+
 @pytest.fixture
-def mock_redis():
+def mock_redis(attempt_script):
     """Create a mock Redis client."""
     mock = AsyncMock(spec=redis.Redis)
-    # Set up default return values
-    mock.get.return_value = None
-    mock.exists.return_value = False
-    mock.incr.return_value = 1
-    mock.setex.return_value = True
-    mock.expire.return_value = True
-    mock.delete.return_value = True
-    mock.scan.return_value = (0, [])
+    # Commands are set explicitly: depending on the redis-py version the spec
+    # can expose them as plain (non-awaitable) methods
+    mock.get = AsyncMock(return_value=None)
+    mock.mget = AsyncMock(return_value=[None, None])
+    mock.exists = AsyncMock(return_value=False)
+    mock.setex = AsyncMock(return_value=True)
+    mock.delete = AsyncMock(return_value=True)
+    mock.scan = AsyncMock(return_value=(0, []))
+    mock.close = AsyncMock()
+    mock.register_script = MagicMock(return_value=attempt_script)
+    pipe = MagicMock()
+    pipe.execute = AsyncMock(return_value=[0, 0])
+    mock.pipeline = MagicMock(return_value=pipe)
     return mock
 
 
 @pytest.fixture
-def rate_limit_service(mock_redis):
+def rate_limit_service(mock_redis, monkeypatch):
     """Create a LoginRateLimitService instance with mock Redis."""
+    # Drop the class-level script so it is registered on this test's mock
+    monkeypatch.setattr(LoginRateLimitService, "_record_attempt_script", None)
     return LoginRateLimitService(redis_client=mock_redis)
 
 
@@ -36,44 +57,104 @@ class TestLoginRateLimitService:
 
     @pytest.mark.asyncio
     async def test_record_failed_attempt_first_attempt(
-        self, rate_limit_service, mock_redis
+        self, rate_limit_service, mock_redis, attempt_script
     ):
         """Test recording the first failed login attempt."""
         email = "test@example.com"
-        mock_redis.get.return_value = None
-        mock_redis.incr.return_value = 1
+        attempt_script.return_value = [1, None]
 
         attempts, lockout = await rate_limit_service.record_failed_attempt(email)
 
         assert attempts == 1
         assert lockout is None
-        mock_redis.incr.assert_called_once_with(f"failed_attempts:{email}")
-        mock_redis.expire.assert_called_once()
+        attempt_script.assert_awaited_once()
+        assert attempt_script.call_args.kwargs["keys"] == [
+            f"failed_attempts:{email}",
+            f"account_locked:{email}",
+        ]
+        assert attempt_script.call_args.kwargs["args"][0] == 24 * 3600
+
+    @pytest.mark.asyncio
+    async def test_record_attempt_script_shared_across_instances(
+        self, rate_limit_service, mock_redis, attempt_script
+    ):
+        """Test that the Lua script is registered once, not per instance."""
+        other_service = LoginRateLimitService(redis_client=mock_redis)
+
+        await rate_limit_service.record_failed_attempt("a@example.com")
+        await other_service.record_failed_attempt("b@example.com")
+
+        mock_redis.register_script.assert_called_once()
+        assert attempt_script.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_record_failed_attempt_single_round_trip(
+        self, rate_limit_service, mock_redis, attempt_script
+    ):
+        """Test that an attempt below the threshold costs one Redis call."""
+        attempt_script.return_value = [2, None]
+
+        await rate_limit_service.record_failed_attempt("test@example.com")
+
+        attempt_script.assert_awaited_once()
+        for command in ("get", "incr", "expire", "setex", "delete"):
+            getattr(mock_redis, command).assert_not_called()
+
+    @pytest.mark.asyncio
+    @freeze_time("2025-01-24 12:00:00")
+    async def test_record_failed_attempt_while_locked(
+        self, rate_limit_service, mock_redis, attempt_script
+    ):
+        """Test that attempts during a lockout return the existing lockout."""
+        lockout_time = datetime.utcnow() + timedelta(minutes=3)
+        attempt_script.return_value = [5, epoch(lockout_time)]
+
+        attempts, lockout = await rate_limit_service.record_failed_attempt(
+            "test@example.com"
+        )
+
+        assert attempts == 5
+        assert lockout == lockout_time
+        mock_redis.setex.assert_not_called()
+
+    @pytest.mark.asyncio
+    @freeze_time("2025-01-24 12:00:00")
+    async def test_record_failed_attempt_while_legacy_locked(
+        self, rate_limit_service, mock_redis, attempt_script
+    ):
+        """Test that a legacy ISO lockout returned by the script is parsed."""
+        lockout_time = datetime.utcnow() + timedelta(minutes=3)
+        attempt_script.return_value = [5, lockout_time.isoformat()]
+
+        _, lockout = await rate_limit_service.record_failed_attempt(
+            "test@example.com"
+        )
+
+        assert lockout == lockout_time
 
     @pytest.mark.asyncio
     async def test_record_failed_attempt_below_threshold(
-        self, rate_limit_service, mock_redis
+        self, rate_limit_service, mock_redis, attempt_script
     ):
         """Test recording failed attempts below the lockout threshold."""
         email = "test@example.com"
-        mock_redis.get.return_value = None
-        mock_redis.incr.return_value = 3
+        attempt_script.return_value = [3, None]
 
         attempts, lockout = await rate_limit_service.record_failed_attempt(email)
 
         assert attempts == 3
         assert lockout is None
-        mock_redis.incr.assert_called_once()
+        attempt_script.assert_awaited_once()
+        mock_redis.setex.assert_not_called()
 
     @pytest.mark.asyncio
     @freeze_time("2025-01-24 12:00:00")
     async def test_record_failed_attempt_triggers_lockout(
-        self, rate_limit_service, mock_redis
+        self, rate_limit_service, mock_redis, attempt_script
     ):
         """Test that reaching max attempts triggers account lockout."""
         email = "test@example.com"
-        mock_redis.get.return_value = None
-        mock_redis.incr.return_value = 5  # Max attempts reached
+        attempt_script.return_value = [5, None]  # Max attempts reached
 
         attempts, lockout = await rate_limit_service.record_failed_attempt(email)
 
@@ -86,13 +167,13 @@ class TestLoginRateLimitService:
         call_args = mock_redis.setex.call_args
         assert call_args[0][0] == f"account_locked:{email}"
         assert call_args[0][1] == 60  # 1 minute lockout
+        assert str(call_args[0][2]) == epoch(lockout)
 
     @pytest.mark.asyncio
     @freeze_time("2025-01-24 12:00:00")
-    async def test_exponential_backoff(self, rate_limit_service, mock_redis):
+    async def test_exponential_backoff(self, rate_limit_service, attempt_script):
         """Test exponential backoff calculation for lockout duration."""
         email = "test@example.com"
-        mock_redis.get.return_value = None
 
         # Test different attempt counts and expected lockout durations
         test_cases = [
@@ -104,7 +185,7 @@ class TestLoginRateLimitService:
         ]
 
         for attempts, expected_minutes in test_cases:
-            mock_redis.incr.return_value = attempts
+            attempt_script.return_value = [attempts, None]
             _, lockout = await rate_limit_service.record_failed_attempt(email)
 
             if lockout:
@@ -115,7 +196,7 @@ class TestLoginRateLimitService:
     async def test_check_rate_limit_not_locked(self, rate_limit_service, mock_redis):
         """Test checking rate limit for unlocked account."""
         email = "test@example.com"
-        mock_redis.get.side_effect = [None, "3"]  # Not locked, 3 attempts
+        mock_redis.mget.return_value = [None, "3"]  # Not locked, 3 attempts
 
         is_allowed, lockout, attempts = await rate_limit_service.check_rate_limit(email)
 
@@ -129,7 +210,7 @@ class TestLoginRateLimitService:
         """Test checking rate limit for locked account."""
         email = "test@example.com"
         lockout_time = datetime.utcnow() + timedelta(minutes=5)
-        mock_redis.get.side_effect = [lockout_time.isoformat(), "5"]
+        mock_redis.mget.return_value = [epoch(lockout_time), "5"]
 
         is_allowed, lockout, attempts = await rate_limit_service.check_rate_limit(email)
 
@@ -145,7 +226,7 @@ class TestLoginRateLimitService:
         """Test that expired lockouts are cleared."""
         email = "test@example.com"
         expired_time = datetime.utcnow() - timedelta(minutes=1)
-        mock_redis.get.side_effect = [expired_time.isoformat(), "0"]
+        mock_redis.mget.return_value = [epoch(expired_time), "0"]
 
         is_allowed, lockout, attempts = await rate_limit_service.check_rate_limit(email)
 
@@ -154,6 +235,41 @@ class TestLoginRateLimitService:
         assert attempts == 0
         mock_redis.delete.assert_called_once_with(f"account_locked:{email}")
 
+    @pytest.mark.asyncio
+    @freeze_time("2025-01-24 12:00:00")
+    async def test_check_rate_limit_legacy_iso_lockout(
+        self, rate_limit_service, mock_redis
+    ):
+        """Test that a lockout stored in the old ISO format is still honoured."""
+        lockout_time = datetime.utcnow().replace(microsecond=0) + timedelta(
+            minutes=5
+        )
+        mock_redis.mget.return_value = [lockout_time.isoformat(), "5"]
+
+        is_allowed, lockout, attempts = await rate_limit_service.check_rate_limit(
+            "test@example.com"
+        )
+
+        assert is_allowed is False
+        assert lockout == lockout_time
+        assert attempts == 5
+        mock_redis.delete.assert_not_called()
+
+    @pytest.mark.asyncio
+    @freeze_time("2025-01-24 12:00:00")
+    async def test_check_rate_limit_unparseable_lockout(
+        self, rate_limit_service, mock_redis
+    ):
+        """Test that a lockout that is not a timestamp at all counts as expired."""
+        mock_redis.mget.return_value = ["not-a-timestamp", "5"]
+
+        is_allowed, lockout, _ = await rate_limit_service.check_rate_limit(
+            "test@example.com"
+        )
+
+        assert is_allowed is True
+        assert lockout is None
+
     @pytest.mark.asyncio
     async def test_clear_failed_attempts(self, rate_limit_service, mock_redis):
         """Test clearing failed attempts after successful login."""
@@ -170,21 +286,24 @@ class TestLoginRateLimitService:
     async def test_unlock_account_success(self, rate_limit_service, mock_redis):
         """Test manually unlocking a locked account."""
         email = "test@example.com"
-        mock_redis.exists.return_value = True
+        pipe = mock_redis.pipeline.return_value
+        pipe.execute.return_value = [1, 2]
 
         was_unlocked = await rate_limit_service.unlock_account(email)
 
         assert was_unlocked is True
-        mock_redis.delete.assert_called_once_with(
+        pipe.exists.assert_called_once_with(f"account_locked:{email}")
+        pipe.delete.assert_called_once_with(
             f"account_locked:{email}",
             f"failed_attempts:{email}"
         )
+        pipe.execute.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_unlock_account_not_locked(self, rate_limit_service, mock_redis):
         """Test unlocking an account that wasn't locked."""
         email = "test@example.com"
-        mock_redis.exists.return_value = False
+        mock_redis.pipeline.return_value.execute.return_value = [0, 1]
 
         was_unlocked = await rate_limit_service.unlock_account(email)
 
@@ -207,11 +326,12 @@ class TestLoginRateLimitService:
         future_time = datetime.utcnow() + timedelta(minutes=10)
         past_time = datetime.utcnow() - timedelta(minutes=5)
 
-        mock_redis.get.side_effect = [
-            future_time.isoformat(),  # user1 - still locked
+        mock_redis.mget.return_value = [
+            epoch(future_time),  # user1 - still locked
+            epoch(past_time),    # user2 - expired
+            epoch(future_time),  # user3 - still locked
             "5",  # user1 attempts
-            past_time.isoformat(),    # user2 - expired
-            future_time.isoformat(),  # user3 - still locked
+            "3",  # user2 attempts
             "10"  # user3 attempts
         ]
 
@@ -222,14 +342,17 @@ class TestLoginRateLimitService:
         assert locked_accounts[0]["failed_attempts"] == 5
         assert locked_accounts[1]["email"] == "user3@example.com"
         assert locked_accounts[1]["failed_attempts"] == 10
+        assert mock_redis.scan.call_args.kwargs["count"] == 500
+        mock_redis.mget.assert_awaited_once()
+        mock_redis.get.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_redis_error_handling_record_attempt(
-        self, rate_limit_service, mock_redis
+        self, rate_limit_service, attempt_script
     ):
         """Test that Redis errors don't block login attempts."""
         email = "test@example.com"
-        mock_redis.incr.side_effect = redis.RedisError("Connection failed")
+        attempt_script.side_effect = redis.RedisError("Connection failed")
 
         attempts, lockout = await rate_limit_service.record_failed_attempt(email)
 
@@ -242,7 +365,7 @@ class TestLoginRateLimitService:
     ):
         """Test that Redis errors allow login attempts."""
         email = "test@example.com"
-        mock_redis.get.side_effect = redis.RedisError("Connection failed")
+        mock_redis.mget.side_effect = redis.RedisError("Connection failed")
 
         is_allowed, lockout, attempts = await rate_limit_service.check_rate_limit(email)
 
@@ -251,11 +374,10 @@ class TestLoginRateLimitService:
         assert attempts == 0
 
     @pytest.mark.asyncio
-    async def test_max_lockout_duration(self, rate_limit_service, mock_redis):
+    async def test_max_lockout_duration(self, rate_limit_service, attempt_script):
         """Test that lockout duration doesn't exceed maximum."""
         email = "test@example.com"
-        mock_redis.get.return_value = None
-        mock_redis.incr.return_value = 100  # Very high attempt count
+        attempt_script.return_value = [100, None]  # Very high attempt count
 
         _, lockout = await rate_limit_service.record_failed_attempt(email)
 
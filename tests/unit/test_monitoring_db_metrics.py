@@ -51,6 +51,13 @@ class TestDbMetricsHelpers:
         assert _extract_operation("DROP TABLE todos") == "other"
         assert _extract_operation("ALTER TABLE categories") == "other"
 
+    def test_extract_operation_matches_whole_keyword(self):
+        """Test the verb is matched as a keyword after any leading whitespace."""
+        assert _extract_operation("\n\tSelect 1") == "select"
+        assert _extract_operation("SELECT(1)") == "select"
+        assert _extract_operation("selected_rows") == "other"
+        assert _extract_operation("") == "other"
+
     def test_extract_table_select(self):
         """Test extracting table from SELECT."""
         assert _extract_table("SELECT * FROM users", "select") == "users"
@@ -80,6 +87,28 @@ class TestDbMetricsHelpers:
         """Test extracting table returns unknown for complex queries."""
         assert _extract_table("WITH cte AS (SELECT * FROM users) SELECT * FROM cte", "select") == "unknown"
         assert _extract_table("", "select") == "unknown"
+        assert _extract_table("CREATE TABLE users", "other") == "unknown"
+
+    def test_extract_table_multiline_statement(self):
+        """Test extracting table from statements as SQLAlchemy renders them."""
+        columns = ", ".join(f"todos.col_{i}" for i in range(5000))
+        statement = f"SELECT {columns} \nFROM todos \nWHERE todos.user_id = ?"
+
+        assert _extract_table(statement, "select") == "todos"
+        statement = "DELETE FROM ONLY Todos\nWHERE id = ?"
+        assert _extract_table(statement, "delete") == "todos"
+
+    def test_extractors_are_cached(self):
+        """Test repeated statements are served from the cache."""
+        statement = "SELECT todos.id \nFROM todos \nWHERE todos.id = ?"
+        operation_hits = _extract_operation.cache_info().hits
+        table_hits = _extract_table.cache_info().hits
+
+        for _ in range(3):
+            assert _extract_table(statement, _extract_operation(statement)) == "todos"
+
+        assert _extract_operation.cache_info().hits >= operation_hits + 2
+        assert _extract_table.cache_info().hits >= table_hits + 2
 
 
 class TestPoolMetrics:
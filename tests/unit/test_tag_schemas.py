@@ -0,0 +1,52 @@
+"""Test tag schema validation without going through the API."""
+import pytest
+from pydantic import ValidationError
+
+from app.schemas.tag import TagCreate, TagUpdate
+
+
+class TestTagCreateValidation:
+    """Test that TagCreate rejects invalid names and colors."""
+
+    @pytest.mark.parametrize("color", [
+        "red",
+        "#FFF",
+        "FF5733",
+        "#GG5733",
+        "#FF57331",
+    ])
+    def test_rejects_invalid_color(self, color: str) -> None:
+        """Test that colors must be six-digit hex codes."""
+        with pytest.raises(ValidationError):
+            TagCreate(name="test", color=color)
+
+    @pytest.mark.parametrize("name", ["", "a" * 51])
+    def test_rejects_invalid_name(self, name: str) -> None:
+        """Test that names must be between 1 and 50 characters."""
+        with pytest.raises(ValidationError):
+            TagCreate(name=name)
+
+    @pytest.mark.parametrize("color", ["#FF5733", "#ff5733", None])
+    def test_accepts_valid_color(self, color: str | None) -> None:
+        """Test that hex colors in either case and no color are accepted."""
+        tag = TagCreate(name="test", color=color)
+        assert tag.color == color
+
+    def test_strips_name(self) -> None:
+        """Test that surrounding whitespace is removed from the name."""
+        assert TagCreate(name="  work  ").name == "work"
+
+
+class TestTagUpdateValidation:
+    """Test that TagUpdate applies the same rules to provided fields."""
+
+    def test_rejects_invalid_color(self) -> None:
+        """Test that an invalid color is rejected on update."""
+        with pytest.raises(ValidationError):
+            TagUpdate(color="red")
+
+    def test_accepts_empty_update(self) -> None:
+        """Test that all fields are optional on update."""
+        update = TagUpdate()
+        assert update.name is None
+        assert update.color is None
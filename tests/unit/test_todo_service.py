@@ -1,28 +1,17 @@
 """Unit tests for TodoService."""
 from datetime import datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
 import pytest
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.category import Category
 from app.models.todo import Todo, TodoStatus
 from app.schemas.todo import TodoCreate, TodoFilter, TodoUpdate
 from app.services.todo import TodoService
 
-pytestmark = pytest.mark.asyncio
-
-
-@pytest.fixture
-def mock_db():
-    """Create a mock database session."""
-    mock = AsyncMock(spec=AsyncSession)
-    mock.commit = AsyncMock()
-    mock.refresh = AsyncMock()
-    mock.add = MagicMock()
-    return mock
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 @pytest.fixture
@@ -94,9 +83,6 @@ class TestTodoService:
         self, todo_service, mock_db, sample_user_id, sample_todo_create
     ):
         """Test successful todo creation."""
-        # Mock refresh to simulate database returning the created todo
-        mock_db.refresh = AsyncMock()
-
         # Call the method
         result = await todo_service.create_todo(sample_user_id, sample_todo_create)
 
@@ -1,26 +1,15 @@
 """Unit tests for TodoService status change logic."""
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 from uuid import uuid4
 
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.todo import Todo, TodoStatus
 from app.schemas.todo import TodoUpdate
 from app.services.todo import TodoService
 
-pytestmark = pytest.mark.asyncio
-
-
-@pytest.fixture
-def mock_db():
-    """Create a mock database session."""
-    mock = AsyncMock(spec=AsyncSession)
-    mock.commit = AsyncMock()
-    mock.refresh = AsyncMock()
-    mock.add = MagicMock()
-    return mock
+pytestmark = pytest.mark.asyncio(loop_scope="module")
 
 
 @pytest.fixture